@@ -0,0 +1,1049 @@
+"""PrivacyGuard Ops CLI — presentation layer.
+
+Thin adapter: all business logic lives in core / application layers.
+The CLI only maps user intents to domain calls and formats output.
+
+Dispatch
+--------
+``main()`` routes ``argv`` through a small hand-rolled dispatcher: the
+first positional token selects a ``_cmd_*`` function from ``_COMMANDS``
+and only that command's options are parsed (``argparse``).  Typer/Click
+are never imported on this path, which keeps ``--help``, completion and
+simple commands fast.
+
+The BYOS workflow stubs (``scan``, ``add-url``, ``confirm``, ``optout``,
+``verify``, ``wipe``) live in :mod:`pgo.cli.stubs`, imported only when
+one of them is dispatched.
+
+The Typer application is still available for back-compat: set
+``PGO_FULL_CLI=1`` (or import ``pgo.cli.app``) and the same ``_cmd_*``
+implementations are served through Typer.
+"""
+
+from __future__ import annotations
+
+import builtins
+import os
+import re
+import sys
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from functools import lru_cache
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    import argparse
+    import sqlite3
+
+    import typer
+    from rich.table import Table
+
+    from pgo.core.models import FindingStatus
+    from pgo.core.settings import Settings
+    from pgo.core.settings_cache import SettingsSnapshot
+    from pgo.core.state import TransitionEvent
+
+# Heavy modules (sqlite3, structlog, rich.table, the audit/db/repository
+# stack and the manifest/YAML loader) are imported inside the commands
+# that need them, so parser-only paths (``--help``, completion) stay cheap.
+
+# Rich console-markup tag (``[red]``, ``[/bold]``, ``[dim]``…), same shape
+# as Rich's own tag pattern; a backslash-escaped ``\[`` is literal text.
+_MARKUP_TAG = re.compile(r"(\\*)\[([a-z#/@][^\[]*?)\]")
+
+
+def _strip_markup(text: str) -> str:
+    def _sub(m: re.Match[str]) -> str:
+        backslashes, tag = m.groups()
+        if len(backslashes) % 2:
+            return f"{backslashes[:-1]}[{tag}]"
+        return backslashes
+
+    return _MARKUP_TAG.sub(_sub, text)
+
+
+def _make_printer() -> Callable[..., None]:
+    """Pick the output function once, per environment.
+
+    On a terminal this is ``rich.print``.  When stdout is redirected (a
+    pipe, a file, a test harness) Rich would only parse markup to throw the
+    styling away again, so plain strings go straight to ``builtins.print``
+    with the tags stripped; renderables such as tables still go via Rich.
+    """
+    if sys.stdout.isatty():
+        from rich import print as rich_print
+
+        return rich_print
+
+    def _plain_print(*objects: Any, sep: str = " ", end: str = "\n") -> None:
+        if all(isinstance(o, str) for o in objects):
+            builtins.print(_strip_markup(sep.join(objects)), end=end)
+            return
+        from rich import print as rich_print
+
+        rich_print(*objects, sep=sep, end=end)
+
+    return _plain_print
+
+
+print = _make_printer()
+
+_PROG = "pgo"
+_DESCRIPTION = "PrivacyGuard Ops — local-first opt-out auditing CLI."
+
+# Rich colour per finding status (``findings`` table).
+_STATUS_COLORS: dict[str, str] = {
+    "discovered": "white",
+    "confirmed": "cyan",
+    "submitted": "yellow",
+    "pending": "yellow",
+    "verified": "green",
+    "resurfaced": "red",
+}
+
+# Rows rendered per Rich table in ``findings`` (larger lists are paged).
+_FINDINGS_PAGE = 500
+
+# Logging options captured at startup; applied lazily by ``_logger()``.
+_LOG_OPTS: dict[str, Any] = {"level": "INFO", "json_output": True}
+
+
+@lru_cache(maxsize=1)
+def _logger() -> Any:
+    """Configure structlog on first use and return a bound logger."""
+    import structlog
+
+    from pgo.core.logging import configure_logging
+
+    configure_logging(**_LOG_OPTS)
+    return structlog.get_logger()
+
+
+# ── Shared state (settings + DB), keyed in a plain dict ─────
+def _init_state(obj: dict[str, Any], *, log_level: str, log_json: bool) -> None:
+    """Capture logging options + settings, then store them in *obj*."""
+    from pgo.core.errors import RepoRootNotFound
+    from pgo.core.settings_cache import load_settings
+
+    _LOG_OPTS.update(level=log_level, json_output=log_json)
+    try:
+        # Cached resolution skips importing pydantic on the common path.
+        obj["settings"] = load_settings(log_level=log_level, log_json=log_json)
+    except RepoRootNotFound:
+        print(
+            "[red]ERROR:[/red] could not find repo root (pyproject.toml not found in parents)."
+        )
+        raise SystemExit(2)
+
+
+def _settings(obj: dict[str, Any]) -> Settings | SettingsSnapshot:
+    return obj["settings"]
+
+
+def _db(obj: dict[str, Any]) -> sqlite3.Connection:
+    """Return an open DB connection, caching it in *obj*."""
+    if "db" not in obj:
+        from pgo.core.db import open_db
+
+        _logger()  # core modules log through structlog; configure it first.
+        s = _settings(obj)
+        s.ensure_dirs()
+        obj["db"] = open_db(s.db_path)
+    return obj["db"]
+
+
+# ── Commands ────────────────────────────────────────────────
+def _cmd_status(obj: dict[str, Any]) -> None:
+    """Show current system status and directory health."""
+    s = _settings(obj)
+
+    print("[bold]PrivacyGuard Ops[/bold]  v0.1.0")
+    print(f"  Repo root   : {s.repo_root}")
+    print(
+        f"  Manifest    : {s.manifest_path}  {'[green]OK[/green]' if s.manifest_path.exists() else '[red]MISSING[/red]'}"
+    )
+    print(
+        f"  Database    : {s.db_path}  {'[green]OK[/green]' if s.db_path.exists() else '[yellow]NOT CREATED[/yellow]'}"
+    )
+
+    dirs: list[tuple[str, Path | None]] = [
+        ("Vault", s.vault_dir),
+        ("Data", s.data_dir),
+        ("Reports", s.reports_dir),
+        ("Exports", s.exports_dir),
+    ]
+    for label, d in dirs:
+        if d is None:
+            print(f"  {label:<12}: [red]NOT CONFIGURED[/red]")
+            continue
+        print(
+            f"  {label:<12}: {d}  {'[green]OK[/green]' if d.exists() else '[yellow]MISSING[/yellow]'}"
+        )
+
+    # Show finding counts if DB exists.
+    if s.db_path.exists():
+        from pgo.core.repository import list_findings
+
+        conn = _db(obj)
+        findings = list_findings(conn)
+        by_status: dict[str, int] = {}
+        for f in findings:
+            by_status[f.status.value] = by_status.get(f.status.value, 0) + 1
+        if findings:
+            print(f"\n  Findings    : {len(findings)} total")
+            for st, count in sorted(by_status.items()):
+                print(f"    {st:<14}: {count}")
+        else:
+            print("\n  Findings    : 0 (run [bold]pgo add[/bold] to start tracking)")
+
+    _logger().info("status_checked", repo_root=str(s.repo_root))
+
+
+def _cmd_init(obj: dict[str, Any]) -> None:
+    """Initialise PGO: create directories and database."""
+    s = _settings(obj)
+    _logger()
+    s.ensure_dirs()
+    _db(obj)  # creates the DB and schema
+    print("[green]PGO initialised.[/green]  Directories + database ready.")
+    _logger().info("pgo_initialised", repo_root=str(s.repo_root), db=str(s.db_path))
+
+
+def _cmd_plan(obj: dict[str, Any]) -> None:
+    """Load broker manifest and display the plan (brokers + steps)."""
+    from pgo.core.errors import ManifestInvalid, ManifestNotFound
+    from pgo.manifest import load_brokers_manifest
+
+    s = _settings(obj)
+    try:
+        brokers = load_brokers_manifest(s.manifest_path, use_cache=True)
+    except (ManifestNotFound, ManifestInvalid) as exc:
+        print(f"[red]ERROR:[/red] {exc}")
+        raise SystemExit(1)
+
+    print(f"[bold]Broker plan[/bold]  ({len(brokers)} brokers)")
+    for b in brokers:
+        print(f"  • {b.name}  {b.url or ''}")
+    _logger().info("plan_loaded", broker_count=len(brokers))
+
+
+def _cmd_manifest_validate(obj: dict[str, Any], manifest: Path | None = None) -> None:
+    """Validate the brokers manifest schema."""
+    from pgo.core.errors import ManifestInvalid, ManifestNotFound, PGOError
+    from pgo.manifest import load_brokers_manifest
+
+    s = _settings(obj)
+    manifest_path = manifest if manifest else s.manifest_path
+    if not manifest_path.is_absolute():
+        assert s.repo_root is not None  # guaranteed by model_validator
+        manifest_path = (s.repo_root / manifest_path).resolve()
+
+    try:
+        brokers = load_brokers_manifest(manifest_path)
+    except (ManifestNotFound, ManifestInvalid, PGOError) as exc:
+        print(f"[red]ERROR:[/red] {exc}")
+        raise SystemExit(1)
+
+    print(f"[green]OK[/green] manifest valid: {manifest_path} ({len(brokers)} brokers)")
+
+
+# ── Finding management ──────────────────────────────────────
+def _cmd_add(
+    obj: dict[str, Any], finding_id: str, broker: str, url: str | None = None
+) -> None:
+    """Add a new finding (broker profile) in DISCOVERED state."""
+    import sqlite3
+
+    from pgo.core.audit import append as audit_append
+    from pgo.core.models import FindingStatus
+    from pgo.core.repository import create_finding
+    from pgo.core.state import TransitionEvent
+
+    conn = _db(obj)
+    # The finding and its creation event commit together.
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        f = create_finding(conn, finding_id=finding_id, broker_name=broker, url=url)
+        # Audit the creation as a transition from none → discovered.
+        event = TransitionEvent(
+            finding_id=f.finding_id,
+            from_status=FindingStatus.DISCOVERED,
+            to_status=FindingStatus.DISCOVERED,
+            at_utc=f.created_utc,
+        )
+        audit_append(conn, event, notes="Finding created")
+        conn.commit()
+    except ValueError as exc:
+        conn.rollback()
+        print(f"[red]ERROR:[/red] {exc}")
+        raise SystemExit(1)
+    except sqlite3.IntegrityError:
+        conn.rollback()
+        print(f"[red]ERROR:[/red] Finding '{finding_id}' already exists.")
+        raise SystemExit(1)
+    except BaseException:
+        conn.rollback()
+        raise
+
+    print(f"[green]Added:[/green] {f.finding_id} — {f.broker_name}  [{f.status.value}]")
+
+
+def _cmd_findings(obj: dict[str, Any], limit: int = 1000) -> None:
+    """List all tracked findings."""
+    from pgo.core.repository import count_findings, iter_findings
+
+    conn = _db(obj)
+    total = count_findings(conn)
+
+    if not total:
+        print("[yellow]No findings yet.[/yellow] Run [bold]pgo add[/bold] to start.")
+        return
+
+    # Rows are streamed and rendered in pages, so Rich never lays out more
+    # than _FINDINGS_PAGE rows at once.
+    shown = 0
+    table = _findings_table(title="Findings", show_header=True)
+    for f in iter_findings(conn, limit=limit if limit > 0 else None):
+        if shown and shown % _FINDINGS_PAGE == 0:
+            print(table)
+            table = _findings_table(title=None, show_header=False)
+        color = _STATUS_COLORS.get(f.status.value, "white")
+        table.add_row(
+            f.finding_id,
+            f.broker_name,
+            f"[{color}]{f.status.value}[/{color}]",
+            f.url or "",
+            f.updated_utc,
+        )
+        shown += 1
+    print(table)
+
+    if shown < total:
+        print(
+            f"[dim]Showing {shown} of {total} findings; use --limit 0 to list all.[/dim]"
+        )
+
+
+def _findings_table(*, title: str | None, show_header: bool) -> Table:
+    from rich.table import Table
+
+    table = Table(title=title, show_lines=False, show_header=show_header)
+    table.add_column("ID", style="bold")
+    table.add_column("Broker")
+    table.add_column("Status")
+    table.add_column("URL")
+    table.add_column("Updated")
+    return table
+
+
+def _cmd_transition(
+    obj: dict[str, Any], finding_id: str, to: str, notes: str = ""
+) -> None:
+    """Move a finding to a new status (with audit trail)."""
+    from pgo.core.errors import StateTransitionInvalid
+    from pgo.core.models import STATUS_BY_VALUE, VALID_STATUS_VALUES
+    from pgo.modules.pii_guard import sanitise_notes
+
+    # Validate target status.
+    to_status = STATUS_BY_VALUE.get(to.lower())
+    if to_status is None:
+        print(f"[red]ERROR:[/red] Invalid status '{to}'. Valid: {VALID_STATUS_VALUES}")
+        raise SystemExit(1)
+
+    # Sanitise notes at the CLI boundary (Zero Trust).
+    notes = sanitise_notes(notes)
+
+    conn = _db(obj)
+    try:
+        event, entry_hash = _record_transition(conn, finding_id, to_status, notes)
+    except ValueError as exc:
+        print(f"[red]ERROR:[/red] {exc}")
+        raise SystemExit(1)
+    except KeyError:
+        print(f"[red]ERROR:[/red] Finding '{finding_id}' not found.")
+        raise SystemExit(1)
+    except StateTransitionInvalid as exc:
+        print(f"[red]ERROR:[/red] {exc}")
+        raise SystemExit(1)
+
+    print(
+        f"[green]Transitioned:[/green] {finding_id}  "
+        f"{event.from_status.value} → {event.to_status.value}  "
+        f"hash={entry_hash[:12]}…"
+    )
+
+
+def _record_transition(
+    conn: sqlite3.Connection, finding_id: str, to_status: FindingStatus, notes: str
+) -> tuple[TransitionEvent, str]:
+    """Apply a status change and append its audit event in one transaction.
+
+    Either both land or neither does, and the pair costs one commit.
+    Returns the event and its entry hash; repository errors propagate.
+    """
+    from pgo.core.audit import append as audit_append
+    from pgo.core.repository import transition_finding
+
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        event = transition_finding(conn, finding_id, to_status)
+        entry_hash = audit_append(conn, event, notes=notes)
+        conn.commit()
+    except BaseException:
+        conn.rollback()
+        raise
+    return event, entry_hash
+
+
+def _cmd_verify_chain(obj: dict[str, Any]) -> None:
+    """Verify the integrity of the audit chain (tamper detection)."""
+    from pgo.core.audit import verify_chain
+    from pgo.core.errors import AuditChainBroken
+
+    conn = _db(obj)
+    try:
+        count = verify_chain(conn)
+    except AuditChainBroken as exc:
+        print(f"[red bold]INTEGRITY FAILURE:[/red bold] {exc}")
+        raise SystemExit(1)
+
+    print(f"[green]Chain OK[/green] — {count} events verified, no tampering detected.")
+
+
+def _cmd_export_audit(
+    obj: dict[str, Any], output: Path | None = None, verify: bool = True
+) -> None:
+    """Export the full audit trail to JSON."""
+    import stat
+    import tempfile
+
+    from pgo.core.audit import iter_export_audit, iter_serialise_export, new_hmac
+    from pgo.core.errors import AuditChainBroken
+    from pgo.modules.pii_guard import contains_pii
+
+    s = _settings(obj)
+    conn = _db(obj)
+
+    if output is None:
+        assert s.exports_dir is not None
+        s.exports_dir.mkdir(parents=True, exist_ok=True)
+        output = s.exports_dir / "audit.json"
+
+    # Single pass: each event is verified (unless --no-verify), serialised
+    # and streamed to disk with the optional HMAC updated over exactly the
+    # bytes written.  The file is built under a temporary name and only
+    # moved into place once the whole chain has checked out, so a broken
+    # chain never leaves a partial export behind.
+    sig = new_hmac()
+    count = 0
+    pii_found = False
+    fd, tmp_name = tempfile.mkstemp(
+        dir=output.parent, prefix=f".{output.name}.", suffix=".tmp"
+    )
+    tmp = Path(tmp_name)
+    try:
+        with os.fdopen(fd, "wb") as fh:
+            for chunk in iter_serialise_export(iter_export_audit(conn, verify=verify)):
+                fh.write(chunk)
+                if sig is not None:
+                    sig.update(chunk)
+                # Post-export PII scan (defence-in-depth: should not find anything
+                # since notes are sanitised at input, but verify what hits disk).
+                if not pii_found and contains_pii(chunk.decode("utf-8")):
+                    pii_found = True
+                count += 1
+        os.replace(tmp, output)
+    except AuditChainBroken as exc:
+        tmp.unlink(missing_ok=True)
+        print(f"[red bold]INTEGRITY FAILURE:[/red bold] {exc}")
+        print("[yellow]Export aborted. Use --no-verify to force.[/yellow]")
+        raise SystemExit(1)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+    count -= 1  # closing chunk ("]" / "[]") carries no event
+
+    if pii_found:
+        _logger().warning("pii_detected_in_export", event_count=count)
+        print(
+            "[yellow]Warning:[/yellow] PII patterns detected in export. Notes have been sanitised."
+        )
+
+    # Restrict file permissions (owner-only).
+    try:
+        output.chmod(stat.S_IRUSR | stat.S_IWUSR)
+    except OSError:
+        pass  # Best effort (may fail on non-POSIX).
+
+    # Write the optional HMAC signature if vault key is available.
+    if sig is not None:
+        sig_path = output.with_suffix(".json.sig")
+        sig_path.write_text(sig.hexdigest(), encoding="utf-8")
+        try:
+            sig_path.chmod(stat.S_IRUSR | stat.S_IWUSR)
+        except OSError:
+            pass
+        print(f"[green]HMAC signature[/green] → {sig_path}")
+
+    print(f"[green]Exported[/green] {count} events → {output}")
+
+
+# ── BYOS workflow commands (stubs — v0.1) ───────────────────
+def _stub(name: str) -> Callable[..., None]:
+    """Return a runner for ``pgo.cli.stubs.<name>``, imported on first call."""
+
+    def run(*args: Any, **kwargs: Any) -> None:
+        from pgo.cli import stubs
+
+        getattr(stubs, name)(*args, **kwargs)
+
+    run.__name__ = name
+    return run
+
+
+# ── Command table (fast dispatcher) ─────────────────────────
+@dataclass(frozen=True)
+class _Arg:
+    """One ``argparse.add_argument`` call: flags + keyword options."""
+
+    flags: tuple[str, ...]
+    kwargs: dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass(frozen=True)
+class _Command:
+    func: Callable[..., None]
+    help: str
+    args: tuple[_Arg, ...] = ()
+
+
+_NOTES_HELP = "Audit note for this transition."
+
+_COMMANDS: dict[str, _Command] = {
+    "status": _Command(_cmd_status, "Show current system status and directory health."),
+    "init": _Command(_cmd_init, "Initialise PGO: create directories and database."),
+    "plan": _Command(
+        _cmd_plan, "Load broker manifest and display the plan (brokers + steps)."
+    ),
+    "manifest-validate": _Command(
+        _cmd_manifest_validate,
+        "Validate the brokers manifest schema.",
+        (
+            _Arg(
+                ("--manifest",),
+                {
+                    "type": Path,
+                    "default": None,
+                    "help": "Path to brokers manifest YAML (relative to repo root unless absolute).",
+                },
+            ),
+        ),
+    ),
+    "add": _Command(
+        _cmd_add,
+        "Add a new finding (broker profile) in DISCOVERED state.",
+        (
+            _Arg(("finding_id",), {"help": "Unique identifier for this finding."}),
+            _Arg(
+                ("--broker", "-b"),
+                {"required": True, "help": "Name of the data broker."},
+            ),
+            _Arg(("--url", "-u"), {"default": None, "help": "Broker profile URL."}),
+        ),
+    ),
+    "findings": _Command(
+        _cmd_findings,
+        "List all tracked findings.",
+        (
+            _Arg(
+                ("--limit", "-n"),
+                {
+                    "type": int,
+                    "default": 1000,
+                    "help": "Maximum findings to show (0 = all).",
+                },
+            ),
+        ),
+    ),
+    "transition": _Command(
+        _cmd_transition,
+        "Move a finding to a new status (with audit trail).",
+        (
+            _Arg(("finding_id",), {"help": "Finding ID to transition."}),
+            _Arg(
+                ("--to", "-t"),
+                {
+                    "required": True,
+                    "help": "Target status (confirmed, submitted, pending, verified, resurfaced).",
+                },
+            ),
+            _Arg(("--notes", "-n"), {"default": "", "help": _NOTES_HELP}),
+        ),
+    ),
+    "verify-chain": _Command(
+        _cmd_verify_chain, "Verify the integrity of the audit chain (tamper detection)."
+    ),
+    "export-audit": _Command(
+        _cmd_export_audit,
+        "Export the full audit trail to JSON.",
+        (
+            _Arg(
+                ("--output", "-o"),
+                {
+                    "type": Path,
+                    "default": None,
+                    "help": "Output file path (default: exports/audit.json).",
+                },
+            ),
+            _Arg(
+                ("--verify",),
+                {
+                    "action": "BooleanOptionalAction",
+                    "default": True,
+                    "help": "Verify chain before exporting.",
+                },
+            ),
+        ),
+    ),
+    "scan": _Command(
+        _stub("scan"),
+        "Discover candidates (CSE or manual inputs). [stub]",
+        (
+            _Arg(
+                ("query",), {"help": "Search query (e.g. 'site:broker.com John Doe')."}
+            ),
+        ),
+    ),
+    "add-url": _Command(
+        _stub("add_url"),
+        "Add a known public profile URL manually. [stub]",
+        (
+            _Arg(("url",), {"help": "Public profile URL to add."}),
+            _Arg(
+                ("--broker", "-b"),
+                {"required": True, "help": "Name of the data broker."},
+            ),
+            _Arg(
+                ("--id",),
+                {
+                    "dest": "finding_id",
+                    "default": None,
+                    "help": "Custom finding ID (auto-generated if omitted).",
+                },
+            ),
+        ),
+    ),
+    "confirm": _Command(
+        _stub("confirm"),
+        "Confirm an item as 'yours' (BYOS) + capture evidence. [stub]",
+        (
+            _Arg(("finding_id",), {"help": "Finding ID to confirm."}),
+            _Arg(("--notes", "-n"), {"default": "", "help": "Confirmation notes."}),
+        ),
+    ),
+    "optout": _Command(
+        _stub("optout"),
+        "Guided opt-out submission steps (BYOS) + capture proof. [stub]",
+        (
+            _Arg(("finding_id",), {"help": "Finding ID to submit opt-out for."}),
+            _Arg(("--notes", "-n"), {"default": "", "help": "Submission notes."}),
+        ),
+    ),
+    "verify": _Command(
+        _stub("verify"),
+        "Scheduled re-checks (Tier A primary signal). [stub]",
+        (
+            _Arg(
+                ("--finding", "-f"),
+                {
+                    "dest": "finding_id",
+                    "default": None,
+                    "help": "Specific finding to verify.",
+                },
+            ),
+            _Arg(
+                ("--due",),
+                {
+                    "action": "store_true",
+                    "help": "Show only findings due for re-check.",
+                },
+            ),
+        ),
+    ),
+    "wipe": _Command(
+        _stub("wipe"),
+        "Wipe local case data + vault (user initiated). [stub]",
+        (
+            _Arg(
+                ("--yes",),
+                {
+                    "dest": "confirm_wipe",
+                    "action": "store_true",
+                    "help": "Skip confirmation prompt.",
+                },
+            ),
+        ),
+    ),
+}
+
+_TRUTHY = frozenset({"1", "true", "t", "yes", "y", "on"})
+_FALSY = frozenset({"0", "false", "f", "no", "n", "off"})
+
+
+def _env_bool(name: str, default: bool) -> bool:
+    raw = os.environ.get(name, "").strip().lower()
+    if raw in _TRUTHY:
+        return True
+    if raw in _FALSY:
+        return False
+    return default
+
+
+def _usage() -> str:
+    width = max(len(name) for name in _COMMANDS)
+    lines = [
+        f"Usage: {_PROG} [--log-level LEVEL] [--log-json | --log-text] COMMAND [ARGS]...",
+        "",
+        _DESCRIPTION,
+        "",
+        "Options:",
+        "  --log-level LEVEL       Log level.  [env: PGO_LOG_LEVEL; default: INFO]",
+        "  --log-json / --log-text JSON or human logs.  [env: PGO_LOG_JSON; default: json]",
+        "  -h, --help              Show this message and exit.",
+        "",
+        "Commands:",
+    ]
+    lines += [f"  {name:<{width}}  {cmd.help}" for name, cmd in _COMMANDS.items()]
+    lines += [
+        "",
+        (
+            f"Run '{_PROG} COMMAND --help' for command options, "
+            f"'{_PROG} completion bash|zsh' for a completion script."
+        ),
+    ]
+    return "\n".join(lines)
+
+
+def _command_parser(name: str, cmd: _Command) -> argparse.ArgumentParser:
+    import argparse
+
+    parser = argparse.ArgumentParser(prog=f"{_PROG} {name}", description=cmd.help)
+    for arg in cmd.args:
+        kwargs = dict(arg.kwargs)
+        if kwargs.get("action") == "BooleanOptionalAction":
+            kwargs["action"] = argparse.BooleanOptionalAction
+        parser.add_argument(*arg.flags, **kwargs)
+    return parser
+
+
+def _completion_script(shell: str) -> str:
+    """Static completion script — no per-keystroke ``pgo`` invocation."""
+    names = " ".join(_COMMANDS)
+    opts = {
+        name: " ".join(f for a in cmd.args for f in a.flags if f.startswith("-"))
+        + " --help"
+        for name, cmd in _COMMANDS.items()
+    }
+    if shell == "bash":
+        cases = "\n".join(f'        {name}) opts="{o}" ;;' for name, o in opts.items())
+        return (
+            "_pgo_complete() {\n"
+            '    local cur="${COMP_WORDS[COMP_CWORD]}" cmd="" opts="" w\n'
+            '    for w in "${COMP_WORDS[@]:1:COMP_CWORD-1}"; do\n'
+            '        case "$w" in -*) ;; *) cmd="$w"; break ;; esac\n'
+            "    done\n"
+            '    case "$cmd" in\n'
+            f'        "") opts="{names} --log-level --log-json --log-text --help" ;;\n'
+            f"{cases}\n"
+            "    esac\n"
+            '    COMPREPLY=($(compgen -W "$opts" -- "$cur"))\n'
+            "}\n"
+            f"complete -o default -F _pgo_complete {_PROG}\n"
+        )
+    if shell == "zsh":
+        cases = "\n".join(
+            f"        {name}) compadd -- {o} ;;" for name, o in opts.items()
+        )
+        return (
+            f"#compdef {_PROG}\n"
+            "_pgo() {\n"
+            "    local cmd=${words[(r)[^-]*]:#pgo}\n"
+            "    if (( CURRENT == 2 )) || [[ -z $cmd || $cmd == ${words[CURRENT]} ]]; then\n"
+            f"        compadd -- {names} --log-level --log-json --log-text --help\n"
+            "        return\n"
+            "    fi\n"
+            "    case $cmd in\n"
+            f"{cases}\n"
+            "    esac\n"
+            "}\n"
+            f"compdef _pgo {_PROG}\n"
+        )
+    raise ValueError(f"unsupported shell: {shell!r} (expected bash or zsh)")
+
+
+def _dispatch(argv: list[str]) -> None:
+    """Parse global options, pick the sub-command, run it."""
+    log_level = os.environ.get("PGO_LOG_LEVEL", "INFO")
+    log_json = _env_bool("PGO_LOG_JSON", True)
+
+    i = 0
+    while i < len(argv) and argv[i].startswith("-"):
+        opt = argv[i]
+        if opt in ("-h", "--help"):
+            sys.stdout.write(_usage() + "\n")
+            return
+        if opt == "--log-json":
+            log_json = True
+        elif opt == "--log-text":
+            log_json = False
+        elif opt == "--log-level" and i + 1 < len(argv):
+            i += 1
+            log_level = argv[i]
+        elif opt.startswith("--log-level="):
+            log_level = opt.partition("=")[2]
+        else:
+            sys.stderr.write(f"{_usage()}\n\nError: No such option: {opt}\n")
+            raise SystemExit(2)
+        i += 1
+
+    obj: dict[str, Any] = {}
+    if i == len(argv):
+        # No sub-command: validate the environment, then show help.
+        _init_state(obj, log_level=log_level, log_json=log_json)
+        sys.stdout.write(_usage() + "\n")
+        return
+
+    name, rest = argv[i], argv[i + 1 :]
+    if name == "completion":
+        try:
+            sys.stdout.write(_completion_script(rest[0] if rest else "bash"))
+        except ValueError as exc:
+            print(f"[red]ERROR:[/red] {exc}")
+            raise SystemExit(2)
+        return
+
+    cmd = _COMMANDS.get(name)
+    if cmd is None:
+        sys.stderr.write(f"{_usage()}\n\nError: No such command '{name}'.\n")
+        raise SystemExit(2)
+
+    kwargs = vars(_command_parser(name, cmd).parse_args(rest))
+    _init_state(obj, log_level=log_level, log_json=log_json)
+    with _domain_errors():
+        cmd.func(obj, **kwargs)
+
+
+@contextmanager
+def _domain_errors() -> Iterator[None]:
+    """Report PGO errors a command did not handle itself as ``ERROR:`` + exit 1."""
+    from pgo.core.errors import PGOError
+
+    try:
+        yield
+    except PGOError as exc:
+        print(f"[red]ERROR:[/red] {exc}")
+        raise SystemExit(1) from None
+
+
+# ── Typer application (PGO_FULL_CLI=1 / back-compat) ────────
+@lru_cache(maxsize=1)
+def _typer_app() -> typer.Typer:
+    """Build the Typer app lazily; commands delegate to ``_cmd_*``."""
+    import typer
+
+    # Annotations are strings (``from __future__ import annotations``);
+    # Typer resolves them against module globals, so publish the name there.
+    globals().setdefault("typer", typer)
+
+    app = typer.Typer(help=_DESCRIPTION)
+
+    @app.callback(invoke_without_command=True)
+    def _main_callback(  # pyright: ignore[reportUnusedFunction]
+        ctx: typer.Context,
+        log_level: str = typer.Option(
+            "INFO", "--log-level", envvar="PGO_LOG_LEVEL", help="Log level."
+        ),
+        log_json: bool = typer.Option(
+            True,
+            "--log-json/--log-text",
+            envvar="PGO_LOG_JSON",
+            help="JSON or human logs.",
+        ),
+    ) -> None:
+        """Configure logging + settings, then store in context for sub-commands."""
+        ctx.ensure_object(dict)
+        _init_state(ctx.obj, log_level=log_level, log_json=log_json)
+
+        # If no sub-command given, show help.
+        if ctx.invoked_subcommand is None:
+            print(ctx.get_help())
+
+    @app.command()
+    def status(ctx: typer.Context) -> None:
+        """Show current system status and directory health."""
+        _cmd_status(ctx.obj)
+
+    @app.command()
+    def init(ctx: typer.Context) -> None:
+        """Initialise PGO: create directories and database."""
+        _cmd_init(ctx.obj)
+
+    @app.command()
+    def plan(ctx: typer.Context) -> None:
+        """Load broker manifest and display the plan (brokers + steps)."""
+        _cmd_plan(ctx.obj)
+
+    @app.command(name="manifest-validate")
+    def manifest_validate(
+        ctx: typer.Context,
+        manifest: Path = typer.Option(
+            None,
+            "--manifest",
+            help="Path to brokers manifest YAML (relative to repo root unless absolute).",
+        ),
+    ) -> None:
+        """Validate the brokers manifest schema."""
+        _cmd_manifest_validate(ctx.obj, manifest)
+
+    @app.command()
+    def add(
+        ctx: typer.Context,
+        finding_id: str = typer.Argument(help="Unique identifier for this finding."),
+        broker: str = typer.Option(
+            ..., "--broker", "-b", help="Name of the data broker."
+        ),
+        url: str = typer.Option(None, "--url", "-u", help="Broker profile URL."),
+    ) -> None:
+        """Add a new finding (broker profile) in DISCOVERED state."""
+        _cmd_add(ctx.obj, finding_id, broker, url)
+
+    @app.command()
+    def findings(
+        ctx: typer.Context,
+        limit: int = typer.Option(
+            1000, "--limit", "-n", help="Maximum findings to show (0 = all)."
+        ),
+    ) -> None:
+        """List all tracked findings."""
+        _cmd_findings(ctx.obj, limit)
+
+    @app.command(name="transition")
+    def transition_cmd(
+        ctx: typer.Context,
+        finding_id: str = typer.Argument(help="Finding ID to transition."),
+        to: str = typer.Option(
+            ...,
+            "--to",
+            "-t",
+            help="Target status (confirmed, submitted, pending, verified, resurfaced).",
+        ),
+        notes: str = typer.Option("", "--notes", "-n", help=_NOTES_HELP),
+    ) -> None:
+        """Move a finding to a new status (with audit trail)."""
+        _cmd_transition(ctx.obj, finding_id, to, notes)
+
+    @app.command(name="verify-chain")
+    def verify_chain_cmd(ctx: typer.Context) -> None:
+        """Verify the integrity of the audit chain (tamper detection)."""
+        _cmd_verify_chain(ctx.obj)
+
+    @app.command(name="export-audit")
+    def export_audit_cmd(
+        ctx: typer.Context,
+        output: Path | None = typer.Option(
+            None,
+            "--output",
+            "-o",
+            help="Output file path (default: exports/audit.json).",
+        ),
+        verify: bool = typer.Option(
+            True, "--verify/--no-verify", help="Verify chain before exporting."
+        ),
+    ) -> None:
+        """Export the full audit trail to JSON."""
+        _cmd_export_audit(ctx.obj, output, verify)
+
+    @app.command()
+    def scan(
+        ctx: typer.Context,
+        query: str = typer.Argument(
+            help="Search query (e.g. 'site:broker.com John Doe')."
+        ),
+    ) -> None:
+        """Discover candidates (CSE or manual inputs). [stub]"""
+        _stub("scan")(ctx.obj, query)
+
+    @app.command(name="add-url")
+    def add_url(
+        ctx: typer.Context,
+        url: str = typer.Argument(help="Public profile URL to add."),
+        broker: str = typer.Option(
+            ..., "--broker", "-b", help="Name of the data broker."
+        ),
+        finding_id: str = typer.Option(
+            None, "--id", help="Custom finding ID (auto-generated if omitted)."
+        ),
+    ) -> None:
+        """Add a known public profile URL manually. [stub]"""
+        _stub("add_url")(ctx.obj, url, broker, finding_id)
+
+    @app.command()
+    def confirm(
+        ctx: typer.Context,
+        finding_id: str = typer.Argument(help="Finding ID to confirm."),
+        notes: str = typer.Option("", "--notes", "-n", help="Confirmation notes."),
+    ) -> None:
+        """Confirm an item as 'yours' (BYOS) + capture evidence. [stub]"""
+        _stub("confirm")(ctx.obj, finding_id, notes)
+
+    @app.command()
+    def optout(
+        ctx: typer.Context,
+        finding_id: str = typer.Argument(help="Finding ID to submit opt-out for."),
+        notes: str = typer.Option("", "--notes", "-n", help="Submission notes."),
+    ) -> None:
+        """Guided opt-out submission steps (BYOS) + capture proof. [stub]"""
+        _stub("optout")(ctx.obj, finding_id, notes)
+
+    @app.command(name="verify")
+    def verify_cmd(
+        ctx: typer.Context,
+        finding_id: str = typer.Option(
+            None, "--finding", "-f", help="Specific finding to verify."
+        ),
+        due: bool = typer.Option(
+            False, "--due", help="Show only findings due for re-check."
+        ),
+    ) -> None:
+        """Scheduled re-checks (Tier A primary signal). [stub]"""
+        _stub("verify")(ctx.obj, finding_id, due)
+
+    @app.command()
+    def wipe(
+        ctx: typer.Context,
+        confirm_wipe: bool = typer.Option(
+            False, "--yes", help="Skip confirmation prompt."
+        ),
+    ) -> None:
+        """Wipe local case data + vault (user initiated). [stub]"""
+        _stub("wipe")(ctx.obj, confirm_wipe)
+
+    return app
+
+
+def __getattr__(name: str) -> Any:
+    # ``pgo.cli.app`` keeps working for code that embeds the Typer app.
+    if name == "app":
+        return _typer_app()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+# ── Entrypoint ──────────────────────────────────────────────
+def main() -> None:  # noqa: D103
+    if os.environ.get("PGO_FULL_CLI") == "1":
+        with _domain_errors():
+            _typer_app()()
+        return
+    _dispatch(sys.argv[1:])
@@ -0,0 +1,122 @@
+"""BYOS workflow commands (stubs — v0.1).
+
+Imported only when one of these sub-commands is dispatched, so their
+bodies stay off the CLI's startup path.  Each takes the shared state dict
+built by :func:`pgo.cli._init_state` and exits via ``SystemExit`` like
+the other ``_cmd_*`` implementations.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+from pgo.cli import _db, _record_transition, _settings, print
+
+
+def scan(obj: dict[str, Any], query: str) -> None:
+    """Discover candidates (CSE or manual inputs). [stub]"""
+    _ = _settings(obj)
+    print(f"[yellow]scan[/yellow] is not yet implemented. Query: {query}")
+    print("This will search for broker profiles matching your query.")
+    raise SystemExit(0)
+
+
+def add_url(
+    obj: dict[str, Any], url: str, broker: str, finding_id: str | None = None
+) -> None:
+    """Add a known public profile URL manually. [stub]"""
+    _ = _settings(obj)
+    print("[yellow]add-url[/yellow] is not yet fully implemented.")
+    print(f"  Broker: {broker}")
+    print(f"  URL   : {url}")
+    print("Use [bold]pgo add[/bold] for the current working implementation.")
+    raise SystemExit(0)
+
+
+def confirm(obj: dict[str, Any], finding_id: str, notes: str = "") -> None:
+    """Confirm an item as 'yours' (BYOS) + capture evidence. [stub]"""
+    from pgo.core.errors import StateTransitionInvalid
+    from pgo.core.models import FindingStatus
+
+    conn = _db(obj)
+    try:
+        event, entry_hash = _record_transition(
+            conn, finding_id, FindingStatus.CONFIRMED, notes
+        )
+    except ValueError as exc:
+        print(f"[red]ERROR:[/red] {exc}")
+        raise SystemExit(1)
+    except KeyError:
+        print(f"[red]ERROR:[/red] Finding '{finding_id}' not found.")
+        raise SystemExit(1)
+    except StateTransitionInvalid as exc:
+        print(f"[red]ERROR:[/red] {exc}")
+        raise SystemExit(1)
+
+    print(
+        f"[green]Confirmed:[/green] {finding_id}  "
+        f"{event.from_status.value} → {event.to_status.value}  "
+        f"hash={entry_hash[:12]}…"
+    )
+    print("[yellow]Evidence capture not yet implemented.[/yellow]")
+
+
+def optout(obj: dict[str, Any], finding_id: str, notes: str = "") -> None:
+    """Guided opt-out submission steps (BYOS) + capture proof. [stub]"""
+    from pgo.core.errors import StateTransitionInvalid
+    from pgo.core.models import FindingStatus
+
+    conn = _db(obj)
+    try:
+        event, entry_hash = _record_transition(
+            conn, finding_id, FindingStatus.SUBMITTED, notes
+        )
+    except ValueError as exc:
+        print(f"[red]ERROR:[/red] {exc}")
+        raise SystemExit(1)
+    except KeyError:
+        print(f"[red]ERROR:[/red] Finding '{finding_id}' not found.")
+        raise SystemExit(1)
+    except StateTransitionInvalid as exc:
+        print(f"[red]ERROR:[/red] {exc}")
+        raise SystemExit(1)
+
+    print(
+        f"[green]Opt-out submitted:[/green] {finding_id}  "
+        f"{event.from_status.value} → {event.to_status.value}  "
+        f"hash={entry_hash[:12]}…"
+    )
+    print("[yellow]Submission proof capture not yet implemented.[/yellow]")
+
+
+def verify(
+    obj: dict[str, Any], finding_id: str | None = None, due: bool = False
+) -> None:
+    """Scheduled re-checks (Tier A primary signal). [stub]"""
+    _ = _settings(obj)
+    if due:
+        print("[yellow]--due filtering is not yet implemented.[/yellow]")
+    if finding_id:
+        print(
+            f"[yellow]verify[/yellow] for finding '{finding_id}' is not yet implemented."
+        )
+    else:
+        print("[yellow]verify[/yellow] (batch re-check) is not yet implemented.")
+    print("This will re-visit broker pages to detect resurfacing.")
+    raise SystemExit(0)
+
+
+def wipe(obj: dict[str, Any], confirm_wipe: bool = False) -> None:
+    """Wipe local case data + vault (user initiated). [stub]"""
+    s = _settings(obj)
+    if not confirm_wipe:
+        print(
+            "[red bold]WARNING:[/red bold] This will delete ALL local data (DB + vault)."
+        )
+        print("Run with --yes to confirm.")
+        raise SystemExit(1)
+
+    # TODO: implement actual wipe of vault_dir, data_dir, reports_dir, exports_dir
+    print("[yellow]wipe[/yellow] is not yet fully implemented.")
+    print(f"  Would delete: {s.data_dir}, {s.vault_dir}")
+    raise SystemExit(0)
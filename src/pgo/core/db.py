@@ -1,14 +1,22 @@
 """SQLite database manager.
 
 Owns the connection lifecycle, schema creation, and migration.
-Every other module that needs the DB receives the connection from here — 
+Every other module that needs the DB receives the connection from here —
 they never open their own.
 
 Design decisions
 ----------------
-* WAL mode for concurrent reads.
+* WAL mode for concurrent reads, ``synchronous=NORMAL`` (durable across
+  application crashes; a power loss can drop only the last commits, never
+  corrupt the file).  WAL keeps ``<db>-wal`` / ``<db>-shm`` siblings next
+  to the database — anything that deletes or copies the DB must handle
+  them too.
+* Connection-level tuning (``_PRAGMAS``): in-memory temp store, a 256 MiB
+  mmap window and a 64 MiB page cache.
 * Foreign keys enforced.
-* ``CREATE TABLE IF NOT EXISTS`` — idempotent, safe to call on every start.
+* ``CREATE TABLE IF NOT EXISTS`` — idempotent, safe to call on every start;
+  older databases are upgraded in place by ``_migrate()``.  Databases
+  already at ``SCHEMA_VERSION`` (per ``PRAGMA user_version``) skip it.
 * All writes inside explicit transactions (atomicity).
 """
 
@@ -16,6 +24,7 @@ from __future__ import annotations
 
 import sqlite3
 import stat
+from collections.abc import Mapping
 from pathlib import Path
 
 import structlog
@@ -23,7 +32,7 @@ import structlog
 logger = structlog.get_logger()
 
 # ── Schema version (bump when tables change) ────────────────
-SCHEMA_VERSION = 1
+SCHEMA_VERSION = 3
 
 _SCHEMA_SQL = """\
 -- Findings: each broker profile being tracked
@@ -36,7 +45,13 @@ CREATE TABLE IF NOT EXISTS findings (
     updated_utc  TEXT NOT NULL
 );
 
--- Append-only event log (the audit trail)
+-- Listing walks this index in order instead of sorting (v3).
+CREATE INDEX IF NOT EXISTS idx_findings_created ON findings(created_utc);
+
+-- Append-only event log (the audit trail).
+-- entry_hash/prev_hash are hex TEXT on purpose: each hash covers the
+-- previous link's hex string, so storing raw digests would change what
+-- is hashed (or force a rewrite of the append-only table).
 CREATE TABLE IF NOT EXISTS events (
     seq          INTEGER PRIMARY KEY AUTOINCREMENT,
     finding_id   TEXT    NOT NULL,
@@ -46,6 +61,7 @@ CREATE TABLE IF NOT EXISTS events (
     entry_hash   TEXT    NOT NULL,
     prev_hash    TEXT    NOT NULL DEFAULT '',
     notes        TEXT    NOT NULL DEFAULT '',
+    hash_algo    TEXT    NOT NULL DEFAULT 'sha256',
     FOREIGN KEY (finding_id) REFERENCES findings(finding_id)
 );
 
@@ -73,13 +89,33 @@ CREATE TRIGGER IF NOT EXISTS events_no_delete
 """
 
 
-def open_db(db_path: Path) -> sqlite3.Connection:
+# Applied on every open (these are per-connection settings).  page_size
+# must come before journal_mode: it only takes effect on a database that
+# has no pages yet, and is a silent no-op for existing files.
+_PRAGMAS: dict[str, str] = {
+    "page_size": "8192",
+    "journal_mode": "WAL",
+    "synchronous": "NORMAL",
+    "foreign_keys": "ON",
+    "temp_store": "MEMORY",
+    "mmap_size": "268435456",
+    "cache_size": "-65536",
+}
+
+
+def open_db(
+    db_path: Path, *, pragmas: Mapping[str, str] | None = None
+) -> sqlite3.Connection:
     """Open (or create) the PGO database and ensure the schema exists.
 
     Parameters
     ----------
     db_path:
         Absolute path to the SQLite file (e.g. ``data/pgo.db``).
+    pragmas:
+        Overrides for individual ``_PRAGMAS`` entries (name → value).
+        Meant for throwaway databases such as test fixtures, which can
+        trade durability for speed; the CLI always uses the defaults.
 
     Returns
     -------
@@ -88,20 +124,21 @@ def open_db(db_path: Path) -> sqlite3.Connection:
     """
     db_path.parent.mkdir(parents=True, exist_ok=True)
 
+    settings = {**_PRAGMAS, **pragmas} if pragmas else _PRAGMAS
     conn = sqlite3.connect(str(db_path), isolation_level=None)
     conn.row_factory = sqlite3.Row
-    conn.execute("PRAGMA journal_mode=WAL")
-    conn.execute("PRAGMA foreign_keys=ON")
-
-    # Create tables idempotently.
-    conn.executescript(_SCHEMA_SQL)
-
-    # Track schema version.
-    conn.execute(
-        "INSERT OR IGNORE INTO meta(key, value) VALUES (?, ?)",
-        ("schema_version", str(SCHEMA_VERSION)),
-    )
-    conn.commit()
+    for name, value in settings.items():
+        conn.execute(f"PRAGMA {name}={value}")
+    # journal_mode is negotiated: SQLite answers with the mode it actually
+    # uses (e.g. "memory" for in-memory DBs, or the old mode on filesystems
+    # without shared-memory support).
+    journal_mode = conn.execute("PRAGMA journal_mode").fetchone()[0]
+    if journal_mode != settings["journal_mode"].lower():
+        logger.warning(
+            "database_wal_unavailable", path=str(db_path), journal_mode=journal_mode
+        )
+
+    _apply_schema(conn)
 
     # Harden file permissions: owner read/write only (Zero Trust).
     try:
@@ -117,3 +154,42 @@ def open_db(db_path: Path) -> sqlite3.Connection:
 
     logger.debug("database_opened", path=str(db_path), schema_version=SCHEMA_VERSION)
     return conn
+
+
+def _apply_schema(conn: sqlite3.Connection) -> None:
+    """Create tables idempotently, migrate, and record the schema version.
+
+    Independent of the file and its pragmas, so tests can build the same
+    schema in a ``:memory:`` database.
+
+    ``PRAGMA user_version`` mirrors the version once the schema is fully
+    in place, so reopening an up-to-date database skips the DDL (and the
+    SQLite parser) entirely.
+    """
+    if conn.execute("PRAGMA user_version").fetchone()[0] == SCHEMA_VERSION:
+        return
+
+    conn.executescript(_SCHEMA_SQL)
+
+    _migrate(conn)
+
+    # Track schema version.
+    conn.execute(
+        "INSERT INTO meta(key, value) VALUES (?, ?) "
+        "ON CONFLICT(key) DO UPDATE SET value = excluded.value",
+        ("schema_version", str(SCHEMA_VERSION)),
+    )
+    conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+    conn.commit()
+
+
+def _migrate(conn: sqlite3.Connection) -> None:
+    """Upgrade databases created by older schema versions in place."""
+    columns = {row["name"] for row in conn.execute("PRAGMA table_info(events)")}
+    if "hash_algo" not in columns:
+        # v1 → v2: per-event chain hash algorithm.  Every v1 chain is SHA-256.
+        # ADD COLUMN does not rewrite rows, so the UPDATE trigger is not hit.
+        conn.execute(
+            "ALTER TABLE events ADD COLUMN hash_algo TEXT NOT NULL DEFAULT 'sha256'"
+        )
+        logger.info("database_migrated", to_version=2)
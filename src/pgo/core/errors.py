@@ -18,7 +18,9 @@ class RepoRootNotFound(PGOError):
 
     def __init__(self, start_path: str | None = None) -> None:
         where = f" (searched from {start_path})" if start_path else ""
-        super().__init__(f"Repository root not found{where}: no pyproject.toml in parent chain")
+        super().__init__(
+            f"Repository root not found{where}: no pyproject.toml in parent chain"
+        )
         self.start_path = start_path
 
 
@@ -54,6 +56,22 @@ class AuditChainBroken(PGOError):
     """Hash-chain integrity verification failed."""
 
 
+class AuditHashUnavailable(PGOError):
+    """The requested audit hash algorithm is unknown or its module is not installed."""
+
+
+class AuditHashMismatch(PGOError):
+    """The configured audit hash algorithm differs from the existing chain's."""
+
+    def __init__(self, chain_algo: str, requested_algo: str) -> None:
+        super().__init__(
+            f"Audit chain uses {chain_algo}; refusing to append {requested_algo} events "
+            f"(unset PGO_AUDIT_HASH or set it to {chain_algo})"
+        )
+        self.chain_algo = chain_algo
+        self.requested_algo = requested_algo
+
+
 # ── Vault ──────────────────────────────────────────────────
 class VaultWriteFailed(PGOError):
     """Evidence could not be written to the vault."""
@@ -83,6 +83,9 @@ def configure_logging(*, level: str = "INFO", json_output: bool = True) -> None:
 
     structlog.configure(
         processors=[
+            # Drop events below the root level before any other processor
+            # (timestamping, PII regex scans) does work on them.
+            structlog.stdlib.filter_by_level,
             *shared_processors,
             structlog.stdlib.ProcessorFormatter.wrap_for_formatter,
         ],
@@ -10,3 +10,9 @@ class FindingStatus(str, Enum):
     PENDING = "pending"
     VERIFIED = "verified"
     RESURFACED = "resurfaced"
+
+
+# Value → member lookup for parsing DB rows and user input (a plain dict
+# hit instead of Enum.__call__), plus the list shown in error messages.
+STATUS_BY_VALUE: dict[str, FindingStatus] = {s.value: s for s in FindingStatus}
+VALID_STATUS_VALUES = ", ".join(STATUS_BY_VALUE)
@@ -17,6 +17,7 @@ relative to cwd would break immediately.
 
 from __future__ import annotations
 
+import os
 from functools import lru_cache
 from pathlib import Path
 
@@ -45,13 +46,29 @@ def find_repo_root(start: Path | None = None) -> Path:
         If no ``pyproject.toml`` is found in *start* or any of its parents.
     """
     origin = (start or Path.cwd()).resolve()
-    for candidate in [origin, *origin.parents]:
-        if (candidate / _MARKER).is_file():
-            return candidate
+    # Probe with plain strings: one stat per level and no intermediate
+    # Path objects; only the hit is turned back into a Path.
+    candidate = str(origin)
+    while True:
+        if os.path.isfile(os.path.join(candidate, _MARKER)):
+            return Path(candidate)
+        parent = os.path.dirname(candidate)
+        if parent == candidate:
+            break
+        candidate = parent
     raise RepoRootNotFound(start_path=str(origin))
 
 
-@lru_cache(maxsize=1)
 def repo_root() -> Path:
-    """Cached version of :func:`find_repo_root` (from cwd at first call)."""
-    return find_repo_root()
+    """Cached :func:`find_repo_root` for the current working directory.
+
+    Keyed on ``os.getcwd()``, so a ``chdir`` is honoured; a marker added
+    or removed later in the same process is not.  Failures are not
+    cached.
+    """
+    return _repo_root_for(os.getcwd())
+
+
+@lru_cache(maxsize=8)
+def _repo_root_for(cwd: str) -> Path:
+    return find_repo_root(Path(cwd))
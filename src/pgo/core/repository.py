@@ -8,18 +8,28 @@ Every state change goes through ``transition_finding()``, which:
 3. Returns a ``TransitionEvent`` (which the caller passes to the audit log).
 
 This module never touches the events table directly — that's ``audit.py``'s job.
+
+Connections are in autocommit mode (``isolation_level=None``), so each
+write here commits on its own unless the caller has opened a
+transaction, in which case it joins it — e.g. to commit a status change
+and its audit event together.
 """
 
 from __future__ import annotations
 
 import sqlite3
+from collections.abc import Iterator
 from dataclasses import dataclass
 from datetime import datetime, timezone
 
 from pgo.core.errors import StateTransitionInvalid
-from pgo.core.models import FindingStatus
+from pgo.core.models import STATUS_BY_VALUE, FindingStatus
 from pgo.core.state import can_transition, TransitionEvent
-from pgo.modules.pii_guard import validate_broker_name, validate_finding_id, validate_url
+from pgo.modules.pii_guard import (
+    validate_broker_name,
+    validate_finding_id,
+    validate_url,
+)
 
 
 @dataclass(frozen=True)
@@ -63,7 +73,6 @@ def create_finding(
         """,
         (finding_id, broker_name, url, FindingStatus.DISCOVERED.value, now, now),
     )
-    conn.commit()
     return Finding(
         finding_id=finding_id,
         broker_name=broker_name,
@@ -87,10 +96,34 @@ def get_finding(conn: sqlite3.Connection, finding_id: str) -> Finding | None:
 
 def list_findings(conn: sqlite3.Connection) -> list[Finding]:
     """Return all findings, ordered by creation date."""
-    rows = conn.execute(
-        "SELECT * FROM findings ORDER BY created_utc"
-    ).fetchall()
-    return [_row_to_finding(r) for r in rows]
+    return list(iter_findings(conn))
+
+
+def iter_findings(
+    conn: sqlite3.Connection,
+    *,
+    limit: int | None = None,
+    batch_size: int = 500,
+) -> Iterator[Finding]:
+    """Yield findings ordered by creation date, fetching *batch_size* rows at a time.
+
+    ``limit`` caps the number of findings returned (``None`` = all).
+    """
+    sql = "SELECT * FROM findings ORDER BY created_utc"
+    params: tuple[int, ...] = ()
+    if limit is not None:
+        sql += " LIMIT ?"
+        params = (limit,)
+    cur = conn.execute(sql, params)
+    while rows := cur.fetchmany(batch_size):
+        for r in rows:
+            yield _row_to_finding(r)
+
+
+def count_findings(conn: sqlite3.Connection) -> int:
+    """Return the total number of findings."""
+    count: int = conn.execute("SELECT COUNT(*) FROM findings").fetchone()[0]
+    return count
 
 
 def transition_finding(
@@ -124,7 +157,6 @@ def transition_finding(
         "UPDATE findings SET status = ?, updated_utc = ? WHERE finding_id = ?",
         (to_status.value, now, finding_id),
     )
-    conn.commit()
 
     return TransitionEvent(
         finding_id=finding_id,
@@ -135,11 +167,16 @@ def transition_finding(
 
 
 def _row_to_finding(row: sqlite3.Row) -> Finding:
+    status = STATUS_BY_VALUE.get(row["status"])
+    if status is None:
+        # Same error FindingStatus(value) raises; a KeyError here would read
+        # as "finding not found" to callers.
+        raise ValueError(f"{row['status']!r} is not a valid FindingStatus")
     return Finding(
         finding_id=row["finding_id"],
         broker_name=row["broker_name"],
         url=row["url"],
-        status=FindingStatus(row["status"]),
+        status=status,
         created_utc=row["created_utc"],
         updated_utc=row["updated_utc"],
     )
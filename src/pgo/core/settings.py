@@ -21,20 +21,23 @@ from __future__ import annotations
 from functools import lru_cache
 from pathlib import Path
 
-import structlog
 from pydantic import model_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
-from pgo.core.paths import find_repo_root
+from pgo.core.paths import repo_root
+from pgo.core.settings_cache import DerivedPathsMixin
 
-logger = structlog.get_logger()
 
-
-class Settings(BaseSettings):
+class Settings(DerivedPathsMixin, BaseSettings):
     """All runtime configuration for PGO.
 
-    *repo_root* anchors every derived path.  If not supplied, it is
-    auto-detected via :func:`pgo.core.paths.find_repo_root`.
+    *repo_root* anchors every derived path.  If not supplied (directly or
+    via ``PGO_REPO_ROOT``), it is auto-detected from cwd via
+    :func:`pgo.core.paths.repo_root`, which memoises the walk per cwd.
+
+    ``manifest_path``, ``db_path`` and ``ensure_dirs()`` come from
+    :class:`pgo.core.settings_cache.DerivedPathsMixin`, shared with the
+    cached :class:`~pgo.core.settings_cache.SettingsSnapshot`.
     """
 
     model_config = SettingsConfigDict(
@@ -72,7 +75,7 @@ class Settings(BaseSettings):
     def _resolve_paths(self) -> "Settings":
         """Fill in any path that was not explicitly overridden."""
         if self.repo_root is None:
-            self.repo_root = find_repo_root()
+            self.repo_root = repo_root()
 
         root = self.repo_root
         defaults: dict[str, Path] = {
@@ -87,35 +90,6 @@ class Settings(BaseSettings):
                 setattr(self, attr, default_val)
         return self
 
-    # ── Convenience ─────────────────────────────────────────
-    @property
-    def manifest_path(self) -> Path:
-        """Full path to the active broker manifest."""
-        assert self.manifests_dir is not None  # guaranteed after validation
-        return self.manifests_dir / self.manifest_filename
-
-    @property
-    def db_path(self) -> Path:
-        """Full path to the SQLite database."""
-        assert self.data_dir is not None  # guaranteed after validation
-        return self.data_dir / self.db_filename
-
-    def ensure_dirs(self) -> None:
-        """Create all local-state directories if they don't exist.
-
-        Applies ``0o700`` (owner-only) permissions as a defence-in-depth
-        measure.  Best-effort on non-POSIX systems.
-        """
-        import stat
-
-        for d in (self.vault_dir, self.data_dir, self.reports_dir, self.exports_dir):
-            assert d is not None  # guaranteed after validation
-            d.mkdir(parents=True, exist_ok=True)
-            try:
-                d.chmod(stat.S_IRWXU)  # 0o700 — owner only
-            except OSError:
-                logger.warning("permission_hardening_failed", path=str(d))
-
 
 @lru_cache(maxsize=1)
 def get_settings(**overrides: object) -> Settings:
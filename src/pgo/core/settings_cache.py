@@ -0,0 +1,237 @@
+"""On-disk cache of resolved settings for fast CLI startup.
+
+Building :class:`pgo.core.settings.Settings` is cheap; *importing*
+pydantic / pydantic-settings to do it is not (~180 ms).  Commands that only
+touch the database never need pydantic otherwise, so the CLI asks
+:func:`load_settings`, which returns a plain :class:`SettingsSnapshot`
+when a cached resolution is still valid and falls back to ``Settings``
+(then refreshes the cache) when it is not.
+
+Cache key
+---------
+A SHA-256 over everything ``Settings`` resolution depends on: cwd, the
+location + mtime of the ``pyproject.toml`` that anchors the repo root,
+the ``.env`` file's mtime/size, the ``PGO_*`` environment variables that
+map to a ``Settings`` field, the explicit overrides, and the package
+version.  The variable holding the vault key (``PGO_VAULT_KEY`` unless
+``vault_encryption_key_env`` says otherwise) is never part of the key:
+``Settings`` only stores its *name*, and a plain digest over the secret
+would be a cheap offline oracle for it.  Only the digest is written to
+disk.
+
+Safety
+------
+The cache is JSON, not pickle: a tampered cache file can at worst point
+the CLI at other directories, never execute code.  It is written
+atomically with owner-only permissions, and any read/parse problem is
+treated as a miss.  Set ``PGO_SETTINGS_CACHE=0`` to bypass it.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import stat
+import tempfile
+from dataclasses import dataclass, fields
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from pgo import __version__
+from pgo.core.paths import _MARKER
+
+if TYPE_CHECKING:
+    from pgo.core.settings import Settings
+
+_CACHE_VERSION = 1
+_PATH_FIELDS = (
+    "repo_root",
+    "manifests_dir",
+    "vault_dir",
+    "data_dir",
+    "reports_dir",
+    "exports_dir",
+)
+_ENV_PREFIX = "PGO_"
+_DEFAULT_KEY_ENV = "PGO_VAULT_KEY"
+
+
+class DerivedPathsMixin:
+    """Convenience paths/helpers shared by ``Settings`` and the snapshot."""
+
+    if TYPE_CHECKING:
+        manifests_dir: Path | None
+        vault_dir: Path | None
+        data_dir: Path | None
+        reports_dir: Path | None
+        exports_dir: Path | None
+        manifest_filename: str
+        db_filename: str
+
+    @property
+    def manifest_path(self) -> Path:
+        """Full path to the active broker manifest."""
+        assert self.manifests_dir is not None  # guaranteed after validation
+        return self.manifests_dir / self.manifest_filename
+
+    @property
+    def db_path(self) -> Path:
+        """Full path to the SQLite database."""
+        assert self.data_dir is not None  # guaranteed after validation
+        return self.data_dir / self.db_filename
+
+    def ensure_dirs(self) -> None:
+        """Create all local-state directories if they don't exist.
+
+        Applies ``0o700`` (owner-only) permissions as a defence-in-depth
+        measure.  Best-effort on non-POSIX systems.
+
+        Runs before every database command, so the usual case (all four
+        already exist, owner-only) costs one ``stat`` per directory
+        instead of ``mkdir`` + ``stat`` + ``chmod``.
+        """
+        for d in (self.vault_dir, self.data_dir, self.reports_dir, self.exports_dir):
+            assert d is not None  # guaranteed after validation
+            try:
+                st = d.stat()
+            except FileNotFoundError:
+                pass
+            else:
+                if stat.S_ISDIR(st.st_mode) and not st.st_mode & (
+                    stat.S_IRWXG | stat.S_IRWXO
+                ):
+                    continue
+            d.mkdir(parents=True, exist_ok=True)
+            try:
+                d.chmod(stat.S_IRWXU)  # 0o700 — owner only
+            except OSError:
+                import structlog
+
+                structlog.get_logger().warning(
+                    "permission_hardening_failed", path=str(d)
+                )
+
+
+@dataclass(frozen=True)
+class SettingsSnapshot(DerivedPathsMixin):
+    """Resolved settings restored from the cache (same attributes as ``Settings``)."""
+
+    repo_root: Path | None
+    manifests_dir: Path | None
+    vault_dir: Path | None
+    data_dir: Path | None
+    reports_dir: Path | None
+    exports_dir: Path | None
+    manifest_filename: str
+    manifest_max_size_kb: int
+    db_filename: str
+    log_level: str
+    log_json: bool
+    vault_encryption_key_env: str
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> SettingsSnapshot:
+        values = {f.name: data[f.name] for f in fields(cls)}
+        for name in _PATH_FIELDS:
+            if values[name] is not None:
+                values[name] = Path(values[name])
+        return cls(**values)
+
+
+# Environment variables Settings reads (``PGO_`` + field name, matched
+# case-insensitively like pydantic-settings).  Taken from the snapshot's
+# fields, which a test pins to ``Settings.model_fields``, so computing the
+# cache key never imports pydantic.
+_SETTINGS_ENV = frozenset(
+    f"{_ENV_PREFIX}{f.name}".upper() for f in fields(SettingsSnapshot)
+)
+
+
+def load_settings(**overrides: Any) -> Settings | SettingsSnapshot:
+    """Return resolved settings, from the cache when still valid.
+
+    Raises :class:`pgo.core.errors.RepoRootNotFound` exactly like
+    ``Settings()`` when no repo root can be found.
+    """
+    if os.environ.get("PGO_SETTINGS_CACHE", "1") == "0":
+        from pgo.core.settings import Settings
+
+        return Settings(**overrides)
+
+    key = _cache_key(overrides)
+    path = cache_path()
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+        if data.get("key") == key:
+            return SettingsSnapshot.from_dict(data["settings"])
+    except (OSError, ValueError, KeyError, TypeError):
+        pass  # Missing or unreadable cache: resolve normally.
+
+    from pgo.core.settings import Settings
+
+    settings = Settings(**overrides)
+    _store(path, {"key": key, "settings": settings.model_dump(mode="json")})
+    return settings
+
+
+def cache_dir() -> Path:
+    """``$XDG_CACHE_HOME/pgo`` (default ``~/.cache/pgo``), shared by PGO's caches."""
+    base = os.environ.get("XDG_CACHE_HOME") or str(Path.home() / ".cache")
+    return Path(base) / "pgo"
+
+
+def cache_path() -> Path:
+    """``<cache_dir>/settings.v<N>.json``."""
+    return cache_dir() / f"settings.v{_CACHE_VERSION}.json"
+
+
+# ── Internal helpers ────────────────────────────────────────
+def _cache_key(overrides: dict[str, Any]) -> str:
+    cwd = Path.cwd().resolve()
+    marker: list[Any] = []
+    for candidate in [cwd, *cwd.parents]:
+        try:
+            st = (candidate / _MARKER).stat()
+        except OSError:
+            continue
+        marker = [str(candidate), st.st_mtime_ns]
+        break
+    try:
+        env_st = (cwd / ".env").stat()
+        env_file: list[int] = [env_st.st_mtime_ns, env_st.st_size]
+    except OSError:
+        env_file = []
+    settings_env = [(k, v) for k, v in os.environ.items() if k.upper() in _SETTINGS_ENV]
+    key_env = overrides.get("vault_encryption_key_env") or next(
+        (v for k, v in settings_env if k.upper() == "PGO_VAULT_ENCRYPTION_KEY_ENV"),
+        _DEFAULT_KEY_ENV,
+    )
+    material = {
+        "version": __version__,
+        "cwd": str(cwd),
+        "marker": marker,
+        "env_file": env_file,
+        "env": sorted(
+            (k, v) for k, v in settings_env if k.upper() != str(key_env).upper()
+        ),
+        "overrides": sorted((k, repr(v)) for k, v in overrides.items()),
+    }
+    blob = json.dumps(material, sort_keys=True).encode("utf-8")
+    return hashlib.sha256(blob).hexdigest()
+
+
+def _store(path: Path, payload: dict[str, Any]) -> None:
+    """Atomically write a JSON cache entry (owner-only); failures are ignored."""
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True, mode=stat.S_IRWXU)
+        fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=".settings-", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as fh:
+                json.dump(payload, fh)
+            os.replace(tmp, path)
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+    except OSError:
+        pass
@@ -8,15 +8,24 @@ from pgo.core.models import FindingStatus
 
 
 # Reglas: de dónde a dónde se puede mover
-ALLOWED_TRANSITIONS: dict[FindingStatus, set[FindingStatus]] = {
-    FindingStatus.DISCOVERED: {FindingStatus.CONFIRMED},
-    FindingStatus.CONFIRMED: {FindingStatus.SUBMITTED},
-    FindingStatus.SUBMITTED: {FindingStatus.PENDING, FindingStatus.VERIFIED},
-    FindingStatus.PENDING: {FindingStatus.VERIFIED, FindingStatus.RESURFACED},
-    FindingStatus.VERIFIED: {FindingStatus.RESURFACED},
-    FindingStatus.RESURFACED: {FindingStatus.SUBMITTED},  # opcional: reintento
+ALLOWED_TRANSITIONS: dict[FindingStatus, frozenset[FindingStatus]] = {
+    FindingStatus.DISCOVERED: frozenset({FindingStatus.CONFIRMED}),
+    FindingStatus.CONFIRMED: frozenset({FindingStatus.SUBMITTED}),
+    FindingStatus.SUBMITTED: frozenset({FindingStatus.PENDING, FindingStatus.VERIFIED}),
+    FindingStatus.PENDING: frozenset(
+        {FindingStatus.VERIFIED, FindingStatus.RESURFACED}
+    ),
+    FindingStatus.VERIFIED: frozenset({FindingStatus.RESURFACED}),
+    FindingStatus.RESURFACED: frozenset(
+        {FindingStatus.SUBMITTED}
+    ),  # opcional: reintento
 }
 
+# Flattened for can_transition: one hash probe, no per-call allocation.
+_ALLOWED_PAIRS: frozenset[tuple[FindingStatus, FindingStatus]] = frozenset(
+    (src, dst) for src, dsts in ALLOWED_TRANSITIONS.items() for dst in dsts
+)
+
 
 @dataclass(frozen=True)
 class TransitionEvent:
@@ -27,10 +36,12 @@ class TransitionEvent:
 
 
 def can_transition(from_status: FindingStatus, to_status: FindingStatus) -> bool:
-    return to_status in ALLOWED_TRANSITIONS.get(from_status, set())
+    return (from_status, to_status) in _ALLOWED_PAIRS
 
 
-def transition(finding_id: str, from_status: FindingStatus, to_status: FindingStatus) -> TransitionEvent:
+def transition(
+    finding_id: str, from_status: FindingStatus, to_status: FindingStatus
+) -> TransitionEvent:
     if not can_transition(from_status, to_status):
         raise StateTransitionInvalid(from_status.value, to_status.value)
 
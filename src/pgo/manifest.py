@@ -3,31 +3,65 @@
 Loads ``brokers_manifest.yaml`` with safety guards:
 
 * Size limit (default 512 KB) — rejects oversized files.
-* ``yaml.safe_load`` only — no arbitrary Python objects.
+* Safe loader only (libyaml's ``CSafeLoader`` when available) — no
+  arbitrary Python objects.
 * Encoding validated (UTF-8).
 * Typed exceptions (:class:`ManifestNotFound`, :class:`ManifestInvalid`,
   :class:`ManifestTooLarge`).
+
+With ``use_cache=True`` the validated entries are kept in
+``<cache_dir>/manifest.v1.json``, keyed by a SHA-256 of the manifest
+bytes, so an unchanged manifest skips YAML parsing and validation.  The
+cache is JSON (never pickle) and every read problem counts as a miss.
+
+Within one process the last few validated manifests are also memoised
+by the same digest, so repeat loads of unchanged bytes skip both the
+parse and the cache file.  The digest, not ``(mtime, size)``, is the key:
+a same-size rewrite inside one mtime tick must not return stale entries.
 """
 
 from __future__ import annotations
 
+import hashlib
+import json
+import os
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
 import yaml
-from pydantic import BaseModel, ConfigDict, field_validator
-
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    TypeAdapter,
+    ValidationError,
+    field_validator,
+)
+
+from pgo import __version__
 from pgo.core.errors import ManifestInvalid, ManifestNotFound, ManifestTooLarge
 
 # Default max manifest size (bytes).
 _DEFAULT_MAX_SIZE_BYTES = 512 * 1024  # 512 KB
 
+# libyaml's C loader is much faster; same safe subset of YAML.
+_SafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+_UTF16_BOMS = (b"\xff\xfe", b"\xfe\xff")
+
+_CACHE_VERSION = 1
+
+# In-process memo: manifest SHA-256 → validated entries (insertion-ordered).
+_MEMO: dict[str, tuple[BrokerTarget, ...]] = {}
+_MEMO_SIZE = 8
+
 
 # ── Pydantic v2 strict models ──────────────────────────────
 class BrokerTarget(BaseModel):
     """A single broker entry from the manifest."""
 
-    model_config = ConfigDict(extra="forbid", frozen=True)
+    # Schema is compiled on first validation, not at import.
+    model_config = ConfigDict(extra="forbid", frozen=True, defer_build=True)
 
     name: str
     id: str | None = None
@@ -46,11 +80,19 @@ class BrokerTarget(BaseModel):
         return v
 
 
+# Built once, on first use: validates the whole entry list in a single
+# core call.
+@lru_cache(maxsize=1)
+def _brokers_adapter() -> TypeAdapter[list[BrokerTarget]]:
+    return TypeAdapter(list[BrokerTarget])
+
+
 # ── Loader ──────────────────────────────────────────────────
 def load_brokers_manifest(
     path: Path,
     *,
     max_size_bytes: int = _DEFAULT_MAX_SIZE_BYTES,
+    use_cache: bool = False,
 ) -> list[BrokerTarget]:
     """Load and validate brokers manifest YAML.
 
@@ -60,6 +102,9 @@ def load_brokers_manifest(
         Absolute or resolved path to the manifest file.
     max_size_bytes:
         Reject files larger than this (defence-in-depth).
+    use_cache:
+        Reuse the entries validated last time if the file's bytes are
+        unchanged (see module docstring).
 
     Returns
     -------
@@ -75,24 +120,74 @@ def load_brokers_manifest(
     ManifestInvalid
         YAML parse error or schema validation failure.
     """
-    if not path.exists():
-        raise ManifestNotFound(f"manifest not found: {path}")
-
-    # Size guard.
-    size = path.stat().st_size
-    if size > max_size_bytes:
-        raise ManifestTooLarge(
-            f"manifest {path.name} is {size:,} bytes (limit {max_size_bytes:,})"
+    # One open + fstat: the size checked is the size of the file read.
+    try:
+        fh = path.open("rb")
+    except (FileNotFoundError, IsADirectoryError) as exc:
+        raise ManifestNotFound(f"manifest not found: {path}") from exc
+    with fh:
+        # Size guard.
+        size = os.fstat(fh.fileno()).st_size
+        if size > max_size_bytes:
+            raise ManifestTooLarge(
+                f"manifest {path.name} is {size:,} bytes (limit {max_size_bytes:,})"
+            )
+        data = fh.read(max_size_bytes + 1)
+    if len(data) > max_size_bytes:  # grew after the fstat
+        raise ManifestTooLarge(f"manifest {path.name} exceeds {max_size_bytes:,} bytes")
+
+    key = hashlib.sha256(data).hexdigest()
+    memo = _MEMO.get(key)
+    if memo is not None:
+        return list(memo)  # entries are frozen; the list is the caller's
+
+    if use_cache:
+        cached = _cache_lookup(key)
+        if cached is not None:
+            _remember(key, cached)
+            return cached
+
+    brokers = _parse_manifest(data)
+    _remember(key, brokers)
+    if use_cache:
+        from pgo.core.settings_cache import _store
+
+        _store(
+            _manifest_cache_path(),
+            {
+                "key": key,
+                "version": __version__,
+                "brokers": [
+                    b.model_dump(mode="json", exclude_unset=True) for b in brokers
+                ],
+            },
         )
+    return brokers
 
-    # Read + parse.
-    try:
-        text = path.read_text(encoding="utf-8")
-    except UnicodeDecodeError as exc:
-        raise ManifestInvalid(f"manifest is not valid UTF-8: {exc}") from exc
+
+# ── Internal helpers ────────────────────────────────────────
+def _parse_manifest(data: bytes) -> list[BrokerTarget]:
+    """Parse and validate manifest bytes.
+
+    The bytes go to the YAML reader as-is, which decodes UTF-8 while it
+    tokenises instead of after a separate ``decode()`` pass.  The reader
+    would also honour a UTF-16 byte-order mark; manifests are UTF-8 only.
+    """
+    if data[:2] in _UTF16_BOMS:
+        raise ManifestInvalid(
+            "manifest is not valid UTF-8: found a UTF-16 byte-order mark"
+        )
 
     try:
-        raw: Any = yaml.safe_load(text)
+        raw: Any = yaml.load(data, Loader=_SafeLoader)
+    except yaml.reader.ReaderError as exc:
+        # Raised for bad encodings and for disallowed characters alike, and
+        # libyaml doesn't say which; re-decode (error path only) to tell.
+        try:
+            data.decode("utf-8")
+        except UnicodeDecodeError as decode_exc:
+            raise ManifestInvalid(f"manifest is not valid UTF-8: {decode_exc}") from exc
+        raise ManifestInvalid(f"YAML parse error: {exc}") from exc
     except yaml.YAMLError as exc:
         raise ManifestInvalid(f"YAML parse error: {exc}") from exc
 
@@ -105,13 +200,13 @@ def load_brokers_manifest(
     elif isinstance(raw, list):
         items = raw
     else:
-        raise ManifestInvalid("manifest schema invalid: expected list or {'brokers': list}")
+        raise ManifestInvalid(
+            "manifest schema invalid: expected list or {'brokers': list}"
+        )
 
     if not isinstance(items, list):
         raise ManifestInvalid("manifest 'brokers' key must contain a list")
 
-    # Validate each entry through Pydantic.
-    out: list[BrokerTarget] = []
     for i, item in enumerate(items):
         if not isinstance(item, dict):
             raise ManifestInvalid(f"manifest item #{i} must be a mapping")
@@ -120,9 +215,33 @@ def load_brokers_manifest(
         if "broker" in item and "name" not in item:
             item["name"] = item.pop("broker")
 
-        try:
-            out.append(BrokerTarget.model_validate(item))
-        except Exception as exc:
-            raise ManifestInvalid(f"manifest item #{i}: {exc}") from exc
+    try:
+        return _brokers_adapter().validate_python(items)
+    except ValidationError as exc:
+        loc = exc.errors()[0]["loc"]
+        raise ManifestInvalid(f"manifest item #{loc[0]}: {exc}") from exc
+
 
-    return out
+def _remember(key: str, brokers: list[BrokerTarget]) -> None:
+    """Memoise *brokers* under digest *key*, evicting the oldest entry."""
+    if len(_MEMO) >= _MEMO_SIZE:
+        del _MEMO[next(iter(_MEMO))]
+    _MEMO[key] = tuple(brokers)
+
+
+def _manifest_cache_path() -> Path:
+    from pgo.core.settings_cache import cache_dir
+
+    return cache_dir() / f"manifest.v{_CACHE_VERSION}.json"
+
+
+def _cache_lookup(key: str) -> list[BrokerTarget] | None:
+    """Return the cached entries for manifest digest *key*, or ``None``."""
+    try:
+        entry = json.loads(_manifest_cache_path().read_text(encoding="utf-8"))
+        if entry.get("key") != key or entry.get("version") != __version__:
+            return None
+        # Entries were validated before they were cached.
+        return [BrokerTarget.model_construct(**item) for item in entry["brokers"]]
+    except (OSError, ValueError, KeyError, TypeError):
+        return None  # Missing or unreadable cache: parse normally.
@@ -24,17 +24,34 @@ _PII_PATTERNS: list[tuple[str, re.Pattern[str]]] = [
     # SSN (US): 123-45-6789 or 123456789
     ("SSN", re.compile(r"\b\d{3}[-]?\d{2}[-]?\d{4}\b")),
     # Email addresses
-    ("EMAIL", re.compile(r"\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z]{2,}\b", re.IGNORECASE)),
+    (
+        "EMAIL",
+        re.compile(r"\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z]{2,}\b", re.IGNORECASE),
+    ),
     # US phone numbers: (555) 123-4567, 555-123-4567, 5551234567, +1-555-123-4567
-    ("PHONE", re.compile(
-        r"(?:\+?1[-.\s]?)?"           # optional country code
-        r"(?:\(?\d{3}\)?[-.\s]?)"     # area code
-        r"\d{3}[-.\s]?\d{4}\b"
-    )),
+    (
+        "PHONE",
+        re.compile(
+            r"(?:\+?1[-.\s]?)?"  # optional country code
+            r"(?:\(?\d{3}\)?[-.\s]?)"  # area code
+            r"\d{3}[-.\s]?\d{4}\b"
+        ),
+    ),
     # Credit card (basic: 13-19 digit sequences with optional separators)
     ("CC", re.compile(r"\b(?:\d[-\s]?){13,19}\b")),
 ]
 
+# Every pattern above needs either an ``@`` (EMAIL) or a digit (the rest),
+# and the ``[REDACTED-…]`` replacements contain neither.  Checking for
+# them once lets most values (event names, statuses, plain prose) skip
+# the regex passes entirely, with exactly the same result.
+#
+# The patterns stay separate ``sub`` passes: one alternation scanned left
+# to right resolves overlapping matches differently (e.g. a CC run
+# swallowing an SSN and the text after it), and can redact less.
+_DIGIT_RE = re.compile(r"\d")
+_REPLACEMENTS = {label: f"[REDACTED-{label}]" for label, _ in _PII_PATTERNS}
+
 # Characters allowed in finding_id / broker_name (whitelist approach).
 _SAFE_ID_RE = re.compile(r"^[A-Za-z0-9_\-. ]{1,128}$")
 
@@ -58,9 +75,14 @@ def redact_pii(text: str) -> str:
     str
         Text with PII patterns replaced.
     """
+    has_at = "@" in text
+    has_digit = _DIGIT_RE.search(text) is not None
+    if not (has_at or has_digit):
+        return text
     result = text
     for label, pattern in _PII_PATTERNS:
-        result = pattern.sub(f"[REDACTED-{label}]", result)
+        if has_at if label == "EMAIL" else has_digit:
+            result = pattern.sub(_REPLACEMENTS[label], result)
     return result
 
 
@@ -72,6 +94,8 @@ def contains_pii(text: str) -> bool:
     bool
         True if any PII pattern matches.
     """
+    if "@" not in text and _DIGIT_RE.search(text) is None:
+        return False
     return any(pattern.search(text) for _, pattern in _PII_PATTERNS)
 
 
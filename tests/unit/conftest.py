@@ -0,0 +1,15 @@
+"""Shared fixtures for the unit tests."""
+
+from __future__ import annotations
+
+import pytest
+
+
+@pytest.fixture(scope="session")
+def fast_pragmas() -> dict[str, str]:
+    """``open_db`` overrides for throwaway databases: no fsyncs, no WAL files.
+
+    ``locking_mode`` stays NORMAL — some audit tests open a second
+    connection to the same file.
+    """
+    return {"journal_mode": "MEMORY", "synchronous": "OFF"}
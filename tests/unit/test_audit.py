@@ -9,21 +9,32 @@ These tests prove the tamper-evident promise:
 
 from __future__ import annotations
 
+import hashlib
+import json
 import sqlite3
 from pathlib import Path
 
 import pytest
 
-from pgo.core.audit import append, export_audit, verify_chain
+from pgo.core import audit
+from pgo.core.audit import (
+    append,
+    append_many,
+    compute_hmac,
+    export_audit,
+    serialise_export,
+    verify_chain,
+)
 from pgo.core.db import open_db
 from pgo.core.repository import create_finding, transition_finding
+from pgo.core.errors import AuditChainBroken, AuditHashMismatch, AuditHashUnavailable
 from pgo.core.models import FindingStatus
 from pgo.core.state import TransitionEvent
 
 
 @pytest.fixture()
-def conn(tmp_path: Path) -> sqlite3.Connection:  # type: ignore[misc]
-    c = open_db(tmp_path / "audit_test.db")
+def conn(tmp_path: Path, fast_pragmas: dict[str, str]) -> sqlite3.Connection:  # type: ignore[misc]
+    c = open_db(tmp_path / "audit_test.db", pragmas=fast_pragmas)
     # Pre-create a finding so FK constraints pass.
     create_finding(c, finding_id="f-1", broker_name="TestBroker")
     yield c  # type: ignore[misc]
@@ -49,7 +60,7 @@ class TestAppend:
     def test_returns_hex_hash(self, conn: sqlite3.Connection) -> None:
         h = append(conn, _make_event())
         assert len(h) == 64  # SHA-256 hex
-        assert all(c in "0123456789abcdef" for c in h)
+        assert set(h) <= set("0123456789abcdef")
 
     def test_first_event_prev_hash_empty(self, conn: sqlite3.Connection) -> None:
         append(conn, _make_event())
@@ -62,6 +73,33 @@ class TestAppend:
         row = conn.execute("SELECT prev_hash FROM events WHERE seq = 2").fetchone()
         assert row["prev_hash"] == h1
 
+    def test_hash_matches_concatenated_form(self, conn: sqlite3.Connection) -> None:
+        """Streamed hashing must stay byte-compatible with existing chains."""
+        h1 = append(conn, _make_event(at_utc="2025-01-15T12:00:00"), notes="n")
+        h2 = append(conn, _make_event(at_utc="2025-01-15T13:00:00"))
+        first = (
+            '{"at_utc":"2025-01-15T12:00:00","finding_id":"f-1",'
+            '"from_status":"discovered","notes":"n","to_status":"confirmed"}'
+        )
+        second = first.replace("12:00:00", "13:00:00").replace('"n"', '""')
+        assert h1 == hashlib.sha256(first.encode("utf-8")).hexdigest()
+        assert h2 == hashlib.sha256((second + h1).encode("utf-8")).hexdigest()
+
+    def test_chains_onto_other_connections_appends(
+        self, conn: sqlite3.Connection, tmp_path: Path, fast_pragmas: dict[str, str]
+    ) -> None:
+        """A second writer's event becomes the next append's prev_hash."""
+        other = open_db(tmp_path / "audit_test.db", pragmas=fast_pragmas)
+        try:
+            append(conn, _make_event(at_utc="2025-01-15T12:00:00"))
+            h2 = append(other, _make_event(at_utc="2025-01-15T13:00:00"))
+            append(conn, _make_event(at_utc="2025-01-15T14:00:00"))
+        finally:
+            other.close()
+        row = conn.execute("SELECT prev_hash FROM events WHERE seq = 3").fetchone()
+        assert row["prev_hash"] == h2
+        assert verify_chain(conn) == 3
+
     def test_notes_included_in_hash(self, conn: sqlite3.Connection) -> None:
         """Notes are now part of the hash chain — different notes
         on identical events produce different hashes."""
@@ -78,6 +116,160 @@ class TestAppend:
         # Hashes differ (different notes + different timestamps + chained).
         assert h1 != h2
 
+    def test_single_append_logs_seq_without_extra_query(
+        self, conn: sqlite3.Connection
+    ) -> None:
+        """The logged seq comes from the INSERT's cursor, not a last_insert_rowid() query."""
+        from structlog.testing import capture_logs
+
+        append(conn, _make_event(at_utc="2025-01-15T01:00:00"))
+        statements: list[str] = []
+        conn.set_trace_callback(statements.append)
+        with capture_logs() as logs:
+            append(conn, _make_event(at_utc="2025-01-15T02:00:00"))
+        conn.set_trace_callback(None)
+
+        assert not any("last_insert_rowid" in sql for sql in statements)
+        assert [e["seq"] for e in logs if e["event"] == "audit_event_appended"] == [2]
+
+    def test_info_logging_gated_by_level(self, conn: sqlite3.Connection) -> None:
+        """At WARNING the per-event log work is skipped; the chain is unaffected."""
+        import logging
+
+        import structlog
+
+        from pgo.core.logging import configure_logging
+
+        configure_logging(level="WARNING")
+        try:
+            assert audit._info_enabled() is False
+            append(conn, _make_event())
+            configure_logging(level="INFO")
+            assert audit._info_enabled() is True
+        finally:
+            structlog.reset_defaults()
+            logging.getLogger().handlers.clear()
+        assert verify_chain(conn) == 1
+
+
+# ── append_many ─────────────────────────────────────────────
+class TestAppendMany:
+    def test_empty_batch(self, conn: sqlite3.Connection) -> None:
+        assert append_many(conn, []) == []
+
+    def test_matches_sequential_appends(
+        self, conn: sqlite3.Connection, tmp_path: Path, fast_pragmas: dict[str, str]
+    ) -> None:
+        events = [
+            (_make_event(at_utc=f"2025-01-15T{i:02d}:00:00"), f"n{i}") for i in range(4)
+        ]
+        hashes = append_many(conn, events)
+
+        other = open_db(tmp_path / "sequential.db", pragmas=fast_pragmas)
+        create_finding(other, finding_id="f-1", broker_name="TestBroker")
+        try:
+            assert hashes == [append(other, e, notes=n) for e, n in events]
+        finally:
+            other.close()
+        assert verify_chain(conn) == 4
+
+    def test_continues_existing_chain(self, conn: sqlite3.Connection) -> None:
+        h1 = append(conn, _make_event(at_utc="2025-01-15T12:00:00"))
+        append_many(conn, [(_make_event(at_utc="2025-01-15T13:00:00"), "")])
+        row = conn.execute("SELECT prev_hash FROM events WHERE seq = 2").fetchone()
+        assert row["prev_hash"] == h1
+
+    def test_batch_is_atomic(self, conn: sqlite3.Connection) -> None:
+        """A failing row (unknown finding → FK violation) writes nothing."""
+        batch = [
+            (_make_event(at_utc="2025-01-15T12:00:00"), ""),
+            (_make_event(finding_id="missing"), ""),
+        ]
+        with pytest.raises(sqlite3.IntegrityError):
+            append_many(conn, batch)
+        assert conn.execute("SELECT COUNT(*) FROM events").fetchone()[0] == 0
+        assert not conn.in_transaction
+        append(conn, _make_event())
+        assert verify_chain(conn) == 1
+
+    def test_chains_onto_rows_written_outside_append(
+        self, conn: sqlite3.Connection
+    ) -> None:
+        """The tip is read from the table, so a raw INSERT on the same connection is seen."""
+        append(conn, _make_event(at_utc="2025-01-15T01:00:00"))
+        _insert_forged(conn, prev_hash="bogus")
+        append(conn, _make_event(at_utc="2025-01-15T03:00:00"))
+        row = conn.execute("SELECT prev_hash FROM events WHERE seq = 3").fetchone()
+        assert row["prev_hash"] == "0" * 64
+
+    def test_joins_caller_transaction(self, conn: sqlite3.Connection) -> None:
+        """Inside the caller's transaction nothing is committed, and a rollback leaves no stale tip."""
+        append(conn, _make_event(at_utc="2025-01-15T01:00:00"))
+        conn.execute("BEGIN")
+        append(conn, _make_event(at_utc="2025-01-15T02:00:00"))
+        assert conn.in_transaction
+        conn.execute("ROLLBACK")
+        append(conn, _make_event(at_utc="2025-01-15T03:00:00"))
+        assert verify_chain(conn) == 2
+
+
+# ── hash algorithm opt-in ────────────────────────────────────
+def _fake_blake3() -> object:
+    """Stand-in for the optional ``blake3`` module (same hasher interface)."""
+    import types
+
+    return types.SimpleNamespace(blake3=lambda: hashlib.blake2b(digest_size=32))
+
+
+class TestHashAlgo:
+    def test_default_is_sha256(
+        self, conn: sqlite3.Connection, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.delenv("PGO_AUDIT_HASH", raising=False)
+        append(conn, _make_event())
+        row = conn.execute("SELECT hash_algo FROM events WHERE seq = 1").fetchone()
+        assert row["hash_algo"] == "sha256"
+
+    def test_unknown_algo_rejected(
+        self, conn: sqlite3.Connection, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setenv("PGO_AUDIT_HASH", "md5")
+        with pytest.raises(AuditHashUnavailable):
+            append(conn, _make_event())
+        assert conn.execute("SELECT COUNT(*) FROM events").fetchone()[0] == 0
+
+    def test_blake3_without_package(
+        self, conn: sqlite3.Connection, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(audit, "blake3", None)
+        monkeypatch.setenv("PGO_AUDIT_HASH", "blake3")
+        with pytest.raises(AuditHashUnavailable):
+            append(conn, _make_event())
+
+    def test_blake3_chain_verifies(
+        self, conn: sqlite3.Connection, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(audit, "blake3", _fake_blake3())
+        monkeypatch.setenv("PGO_AUDIT_HASH", "blake3")
+        h1 = append(conn, _make_event(at_utc="2025-01-15T12:00:00"))
+        append(conn, _make_event(at_utc="2025-01-15T13:00:00"))
+        assert h1 != hashlib.sha256(b"").hexdigest()
+        assert verify_chain(conn) == 2
+        # Verification follows the stored algorithm, not the environment.
+        monkeypatch.delenv("PGO_AUDIT_HASH")
+        assert verify_chain(conn) == 2
+
+    def test_refuses_to_mix_algorithms(
+        self, conn: sqlite3.Connection, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(audit, "blake3", _fake_blake3())
+        monkeypatch.delenv("PGO_AUDIT_HASH", raising=False)
+        append(conn, _make_event(at_utc="2025-01-15T12:00:00"))
+        monkeypatch.setenv("PGO_AUDIT_HASH", "blake3")
+        with pytest.raises(AuditHashMismatch):
+            append(conn, _make_event(at_utc="2025-01-15T13:00:00"))
+        assert verify_chain(conn) == 1
+
 
 # ── verify_chain ────────────────────────────────────────────
 class TestVerifyChain:
@@ -91,18 +283,76 @@ class TestVerifyChain:
         assert count == 1
 
     def test_multi_event_ok(self, conn: sqlite3.Connection) -> None:
-        for i in range(5):
-            append(conn, _make_event(at_utc=f"2025-01-15T{i:02d}:00:00"))
+        append_many(
+            conn,
+            [(_make_event(at_utc=f"2025-01-15T{i:02d}:00:00"), "") for i in range(5)],
+        )
         count = verify_chain(conn)
         assert count == 5
 
-    def test_tamper_entry_hash_blocked_by_trigger(self, conn: sqlite3.Connection) -> None:
+    def test_row_and_event_blobs_agree(self, conn: sqlite3.Connection) -> None:
+        event = _make_event()
+        append(conn, event, notes="née")
+        row = conn.execute("SELECT * FROM events WHERE seq = 1").fetchone()
+        stored = audit._canonical_blob(
+            row["at_utc"],
+            row["finding_id"],
+            row["from_status"],
+            row["notes"],
+            row["to_status"],
+        )
+        assert stored == audit._canonical_blob_event(event, notes="née")
+
+    @pytest.mark.parametrize(
+        "text",
+        [
+            "",
+            "plain",
+            'q"uote',
+            "back\\slash",
+            "tab\tnl\nnul\x00\x1f\x7f",
+            "née",
+            "\u2028",
+            "😀",
+            "\ud800",
+        ],
+    )
+    def test_template_blob_matches_json_dumps(self, text: str) -> None:
+        """The template builders are byte-identical to the original json.dumps form."""
+        event = _make_event(finding_id=f"f-{text}", at_utc=text)
+        fields = {
+            "at_utc": text,
+            "finding_id": f"f-{text}",
+            "from_status": "discovered",
+            "notes": text,
+            "to_status": "confirmed",
+        }
+        expected = json.dumps(fields, sort_keys=True, separators=(",", ":")).encode(
+            "ascii"
+        )
+        assert audit._canonical_blob_event(event, notes=text) == expected
+        assert audit._canonical_blob(**fields) == expected
+
+    def test_batched_fetch_spans_batches(
+        self, conn: sqlite3.Connection, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Linkage is checked across fetchmany() batch boundaries."""
+        monkeypatch.setattr(audit, "_VERIFY_BATCH_SIZE", 2)
+        for i in range(5):
+            append(conn, _make_event(at_utc=f"2025-01-15T{i:02d}:00:00"), notes=f"n{i}")
+        assert verify_chain(conn) == 5
+        assert not conn.in_transaction
+
+    def test_tamper_entry_hash_blocked_by_trigger(
+        self, conn: sqlite3.Connection
+    ) -> None:
         """The DB trigger prevents UPDATE on events — this IS the security control."""
         append(conn, _make_event(at_utc="2025-01-15T01:00:00"))
         append(conn, _make_event(at_utc="2025-01-15T02:00:00"))
 
         # Attempt to tamper: the trigger must block this.
         import sqlite3 as _sqlite3
+
         with pytest.raises(_sqlite3.IntegrityError, match="append-only"):
             conn.execute("UPDATE events SET entry_hash = 'TAMPERED' WHERE seq = 1")
 
@@ -111,15 +361,19 @@ class TestVerifyChain:
         append(conn, _make_event(at_utc="2025-01-15T10:00:00"))
 
         import sqlite3 as _sqlite3
+
         with pytest.raises(_sqlite3.IntegrityError, match="append-only"):
             conn.execute("UPDATE events SET to_status = 'verified' WHERE seq = 1")
 
-    def test_tamper_prev_hash_blocked_by_trigger(self, conn: sqlite3.Connection) -> None:
+    def test_tamper_prev_hash_blocked_by_trigger(
+        self, conn: sqlite3.Connection
+    ) -> None:
         """Altering prev_hash is blocked by the append-only trigger."""
         append(conn, _make_event(at_utc="2025-01-15T01:00:00"))
         append(conn, _make_event(at_utc="2025-01-15T02:00:00"))
 
         import sqlite3 as _sqlite3
+
         with pytest.raises(_sqlite3.IntegrityError, match="append-only"):
             conn.execute("UPDATE events SET prev_hash = 'BAD' WHERE seq = 2")
 
@@ -130,11 +384,21 @@ class TestVerifyChain:
         append(conn, _make_event(at_utc="2025-01-15T03:00:00"))
 
         import sqlite3 as _sqlite3
+
         with pytest.raises(_sqlite3.IntegrityError, match="append-only"):
             conn.execute("DELETE FROM events WHERE seq = 2")
 
 
 # ── export_audit ────────────────────────────────────────────
+def _insert_forged(conn: sqlite3.Connection, *, prev_hash: str) -> None:
+    """Append a row behind ``append()``'s back (INSERT is all the triggers allow)."""
+    conn.execute(
+        "INSERT INTO events (finding_id, from_status, to_status, at_utc, entry_hash, prev_hash, notes) "
+        "VALUES ('f-1', 'confirmed', 'submitted', '2025-01-15T02:00:00', ?, ?, '')",
+        ("0" * 64, prev_hash),
+    )
+
+
 class TestExportAudit:
     def test_empty(self, conn: sqlite3.Connection) -> None:
         assert export_audit(conn) == []
@@ -148,7 +412,17 @@ class TestExportAudit:
     def test_dict_keys(self, conn: sqlite3.Connection) -> None:
         append(conn, _make_event(), notes="test note")
         row = export_audit(conn)[0]
-        expected_keys = {"seq", "finding_id", "from_status", "to_status", "at_utc", "entry_hash", "prev_hash", "notes"}
+        expected_keys = {
+            "seq",
+            "finding_id",
+            "from_status",
+            "to_status",
+            "at_utc",
+            "entry_hash",
+            "prev_hash",
+            "notes",
+            "hash_algo",
+        }
         assert set(row.keys()) == expected_keys
 
     def test_preserves_order(self, conn: sqlite3.Connection) -> None:
@@ -158,12 +432,43 @@ class TestExportAudit:
         seqs = [r["seq"] for r in result]
         assert seqs == sorted(seqs)
 
+    def test_export_verifies_in_same_pass(self, conn: sqlite3.Connection) -> None:
+        append(conn, _make_event(at_utc="2025-01-15T01:00:00"))
+        _insert_forged(conn, prev_hash="bogus")
+        with pytest.raises(AuditChainBroken, match="seq=2"):
+            export_audit(conn)
+        assert not conn.in_transaction
+        assert [e["seq"] for e in export_audit(conn, verify=False)] == [1, 2]
+
+    def test_serialise_export_round_trips(self, conn: sqlite3.Connection) -> None:
+        append(conn, _make_event(), notes="café")
+        events = export_audit(conn)
+        assert json.loads(serialise_export(events)) == events
+
+    def test_orjson_and_stdlib_exports_match(
+        self, conn: sqlite3.Connection, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Both encoders emit the same bytes, so the export signature is the same too."""
+        pytest.importorskip("orjson")
+        monkeypatch.setenv("PGO_VAULT_KEY", "secret")
+        append(conn, _make_event(at_utc="2025-01-15T01:00:00"))
+        append(conn, _make_event(at_utc="2025-01-15T02:00:00"), notes="café → ok")
+        events = export_audit(conn)
+        fast = serialise_export(events)
+        monkeypatch.setattr(audit, "orjson", None)
+        slow = serialise_export(events)
+        assert slow == fast
+        assert compute_hmac(slow) == compute_hmac(fast)
+        assert json.loads(slow) == events
+
 
 # ── Integration: repository + audit together ────────────────
 class TestRepoAuditIntegration:
     def test_full_lifecycle_with_chain(self, conn: sqlite3.Connection) -> None:
         """Create finding → transition through states → verify chain."""
-        create_finding(conn, finding_id="f-int", broker_name="BeenVerified", url="https://bv.com")
+        create_finding(
+            conn, finding_id="f-int", broker_name="BeenVerified", url="https://bv.com"
+        )
 
         # Simulate the creation audit event.
         creation_event = TransitionEvent(
@@ -193,3 +498,15 @@ class TestRepoAuditIntegration:
         # Export should have 4 events.
         events = export_audit(conn)
         assert len(events) == 4
+
+
+def test_import_does_not_load_pii_guard() -> None:
+    """Read-only users of the audit module don't pay for the PII regexes."""
+    import subprocess
+    import sys
+
+    code = "import sys, pgo.core.audit; print('pgo.modules.pii_guard' in sys.modules)"
+    out = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert out.stdout.strip() == "False"
@@ -0,0 +1,190 @@
+"""Tests for pgo.cli — lightweight argv dispatcher."""
+
+from __future__ import annotations
+
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+from pgo import cli
+from pgo.core.audit import compute_hmac
+
+
+@pytest.fixture()
+def repo(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """A throwaway repo root as cwd, with the settings cache kept inside tmp_path."""
+    root = tmp_path / "repo"
+    root.mkdir()
+    (root / "pyproject.toml").touch()
+    monkeypatch.chdir(root)
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    monkeypatch.delenv("PGO_REPO_ROOT", raising=False)
+    return root
+
+
+def test_help_lists_every_command(capsys: pytest.CaptureFixture[str]) -> None:
+    """--help is answered without parsing any sub-command."""
+    cli._dispatch(["--help"])
+    out = capsys.readouterr().out
+    for name in cli._COMMANDS:
+        assert name in out
+
+
+def test_dispatch_does_not_import_typer(monkeypatch: pytest.MonkeyPatch) -> None:
+    """The fast path must never pull Typer/Click in."""
+    monkeypatch.delitem(sys.modules, "typer", raising=False)
+    cli._dispatch(["--help"])
+    assert "typer" not in sys.modules
+
+
+def test_unknown_command_exits_2(capsys: pytest.CaptureFixture[str]) -> None:
+    """Unknown sub-commands mirror Click's usage-error exit code."""
+    with pytest.raises(SystemExit) as exc:
+        cli._dispatch(["bogus"])
+    assert exc.value.code == 2
+    assert "No such command 'bogus'" in capsys.readouterr().err
+
+
+def test_unknown_global_option_exits_2() -> None:
+    """Unknown global options are rejected before any command runs."""
+    with pytest.raises(SystemExit) as exc:
+        cli._dispatch(["--nope", "status"])
+    assert exc.value.code == 2
+
+
+@pytest.mark.parametrize("shell", ["bash", "zsh"])
+def test_completion_script_contains_commands(shell: str) -> None:
+    """Completion scripts are static and list every command."""
+    script = cli._completion_script(shell)
+    for name in cli._COMMANDS:
+        assert name in script
+
+
+def test_completion_rejects_unknown_shell() -> None:
+    """Only bash and zsh are supported."""
+    with pytest.raises(ValueError):
+        cli._completion_script("fish")
+
+
+def test_init_then_add_and_findings(
+    repo: Path, capsys: pytest.CaptureFixture[str]
+) -> None:
+    """End-to-end: init creates the DB, add + findings round-trip through it."""
+    cli._dispatch(["--log-level", "WARNING", "init"])
+    cli._dispatch(["--log-level", "WARNING", "add", "f-1", "--broker", "Acme"])
+    cli._dispatch(["--log-level", "WARNING", "findings"])
+
+    assert "f-1" in capsys.readouterr().out
+    assert (repo / "data").is_dir()
+
+
+def test_export_audit_streams_and_signs(
+    repo: Path, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+) -> None:
+    """The streamed export is valid JSON and its signature covers the file bytes."""
+    monkeypatch.setenv("PGO_VAULT_KEY", "secret")
+
+    cli._dispatch(["--log-level", "WARNING", "add", "f-1", "--broker", "Acme"])
+    out_path = repo / "audit.json"
+    cli._dispatch(["--log-level", "WARNING", "export-audit", "--output", str(out_path)])
+
+    data = out_path.read_bytes()
+    assert [e["finding_id"] for e in json.loads(data)] == ["f-1"]
+    assert out_path.with_suffix(".json.sig").read_text() == compute_hmac(data)
+    assert "Exported 1 events" in capsys.readouterr().out
+
+
+def test_export_audit_broken_chain_leaves_no_file(
+    repo: Path, capsys: pytest.CaptureFixture[str]
+) -> None:
+    """Verification runs during the export; a break aborts before anything lands on disk."""
+    from pgo.core.db import open_db
+
+    cli._dispatch(["--log-level", "WARNING", "add", "f-1", "--broker", "Acme"])
+    conn = open_db(repo / "data" / "pgo.db")
+    conn.execute(
+        "INSERT INTO events (finding_id, from_status, to_status, at_utc, entry_hash, prev_hash, notes) "
+        "VALUES ('f-1', 'discovered', 'confirmed', '2025-01-15T02:00:00', 'x', 'bogus', '')"
+    )
+    conn.close()
+
+    out_path = repo / "audit.json"
+    with pytest.raises(SystemExit) as exc:
+        cli._dispatch(
+            ["--log-level", "WARNING", "export-audit", "--output", str(out_path)]
+        )
+    assert exc.value.code == 1
+    assert "INTEGRITY FAILURE" in capsys.readouterr().out
+    assert list(repo.glob("*audit.json*")) == []
+
+
+def test_transition_and_audit_commit_together(
+    repo: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """If the audit append fails, the status change is rolled back with it."""
+    from pgo.core import audit
+    from pgo.core.db import open_db
+    from pgo.core.repository import get_finding
+
+    cli._dispatch(["--log-level", "WARNING", "add", "f-1", "--broker", "Acme"])
+
+    def _fail(*args: object, **kwargs: object) -> str:
+        raise RuntimeError("disk full")
+
+    monkeypatch.setattr(audit, "append", _fail)
+    with pytest.raises(RuntimeError):
+        cli._dispatch(
+            ["--log-level", "WARNING", "transition", "f-1", "--to", "confirmed"]
+        )
+
+    conn = open_db(repo / "data" / "pgo.db")
+    finding = get_finding(conn, "f-1")
+    assert finding is not None and finding.status.value == "discovered"
+    conn.close()
+
+
+def test_findings_limit_reports_truncation(
+    repo: Path, capsys: pytest.CaptureFixture[str]
+) -> None:
+    """--limit caps the rows rendered and says how many were left out."""
+    for i in range(3):
+        cli._dispatch(["--log-level", "WARNING", "add", f"f-{i}", "--broker", "Acme"])
+    capsys.readouterr()
+    cli._dispatch(["--log-level", "WARNING", "findings", "--limit", "2"])
+
+    out = capsys.readouterr().out
+    assert "f-1" in out
+    assert "f-2" not in out
+    assert "Showing 2 of 3 findings" in out
+
+
+def test_stub_commands_import_lazily(
+    repo: Path, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+) -> None:
+    """pgo.cli.stubs is only imported when a stub command runs."""
+    monkeypatch.delitem(sys.modules, "pgo.cli.stubs", raising=False)
+
+    cli._dispatch(["--help"])
+    assert "pgo.cli.stubs" not in sys.modules
+
+    with pytest.raises(SystemExit) as exc:
+        cli._dispatch(["--log-level", "WARNING", "scan", "jane"])
+    assert exc.value.code == 0
+    assert "pgo.cli.stubs" in sys.modules
+    assert "not yet implemented" in capsys.readouterr().out
+
+
+@pytest.mark.parametrize(
+    ("markup", "plain"),
+    [
+        ("[red]ERROR:[/red] boom", "ERROR: boom"),
+        ("[red bold]X[/red bold] [dim]y[/dim]", "X y"),
+        (r"literal \[brackets] stay", "literal [brackets] stay"),
+        ("Valid: ['pending', 'verified']", "Valid: ['pending', 'verified']"),
+    ],
+)
+def test_strip_markup(markup: str, plain: str) -> None:
+    """Non-TTY output drops Rich tags but keeps escaped and non-tag brackets."""
+    assert cli._strip_markup(markup) == plain
@@ -1,11 +1,12 @@
 """Tests for pgo.core.db — SQLite manager."""
 
+import shutil
 import sqlite3
 from pathlib import Path
 
 import pytest
 
-from pgo.core.db import SCHEMA_VERSION, open_db
+from pgo.core.db import SCHEMA_VERSION, _apply_schema, open_db
 
 
 @pytest.fixture()
@@ -13,6 +14,20 @@ def db_path(tmp_path: Path) -> Path:
     return tmp_path / "test.db"
 
 
+@pytest.fixture(scope="session")
+def template_db(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """A database built by open_db once per session (schema, WAL, pragmas)."""
+    path = tmp_path_factory.mktemp("template") / "template.db"
+    open_db(path).close()
+    return path
+
+
+@pytest.fixture()
+def schema_db(template_db: Path, tmp_path: Path) -> Path:
+    """A private copy of the template, for tests that don't care how it was created."""
+    return Path(shutil.copy(template_db, tmp_path / "test.db"))
+
+
 class TestOpenDb:
     """open_db creates schema, enables WAL + FK, is idempotent."""
 
@@ -21,20 +36,41 @@ class TestOpenDb:
         assert db_path.exists()
         conn.close()
 
-    def test_wal_mode(self, db_path: Path) -> None:
-        conn = open_db(db_path)
+    def test_wal_mode(self, schema_db: Path) -> None:
+        conn = open_db(schema_db)
         mode = conn.execute("PRAGMA journal_mode").fetchone()[0]
         assert mode == "wal"
         conn.close()
 
-    def test_foreign_keys_on(self, db_path: Path) -> None:
-        conn = open_db(db_path)
+    def test_synchronous_normal(self, schema_db: Path) -> None:
+        conn = open_db(schema_db)
+        assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1  # NORMAL
+        assert conn.execute("PRAGMA temp_store").fetchone()[0] == 2  # MEMORY
+        conn.close()
+
+    def test_pragma_overrides(self, db_path: Path) -> None:
+        """Overrides replace single defaults; the rest still apply."""
+        conn = open_db(
+            db_path, pragmas={"journal_mode": "MEMORY", "synchronous": "OFF"}
+        )
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "memory"
+        assert conn.execute("PRAGMA synchronous").fetchone()[0] == 0  # OFF
+        assert conn.execute("PRAGMA foreign_keys").fetchone()[0] == 1
+        conn.close()
+
+    def test_new_database_page_size(self, schema_db: Path) -> None:
+        conn = open_db(schema_db)
+        assert conn.execute("PRAGMA page_size").fetchone()[0] == 8192
+        conn.close()
+
+    def test_foreign_keys_on(self, schema_db: Path) -> None:
+        conn = open_db(schema_db)
         fk = conn.execute("PRAGMA foreign_keys").fetchone()[0]
         assert fk == 1
         conn.close()
 
-    def test_schema_version_stored(self, db_path: Path) -> None:
-        conn = open_db(db_path)
+    def test_schema_version_stored(self, schema_db: Path) -> None:
+        conn = open_db(schema_db)
         row = conn.execute(
             "SELECT value FROM meta WHERE key = 'schema_version'"
         ).fetchone()
@@ -42,8 +78,8 @@ class TestOpenDb:
         assert row["value"] == str(SCHEMA_VERSION)
         conn.close()
 
-    def test_tables_created(self, db_path: Path) -> None:
-        conn = open_db(db_path)
+    def test_tables_created(self, schema_db: Path) -> None:
+        conn = open_db(schema_db)
         tables = {
             row["name"]
             for row in conn.execute(
@@ -68,6 +104,7 @@ class TestOpenDb:
             ).fetchall()
         }
         assert "findings" in tables
+        assert conn2.execute("PRAGMA user_version").fetchone()[0] == SCHEMA_VERSION
         conn2.close()
 
     def test_creates_parent_dirs(self, tmp_path: Path) -> None:
@@ -76,8 +113,29 @@ class TestOpenDb:
         assert nested.exists()
         conn.close()
 
-    def test_row_factory_returns_dict_like(self, db_path: Path) -> None:
-        conn = open_db(db_path)
+    def test_listing_order_uses_index(self, schema_db: Path) -> None:
+        """ORDER BY created_utc walks idx_findings_created; no temp sort."""
+        conn = open_db(schema_db)
+        plan = " ".join(
+            r["detail"]
+            for r in conn.execute(
+                "EXPLAIN QUERY PLAN SELECT * FROM findings ORDER BY created_utc"
+            )
+        )
+        assert "idx_findings_created" in plan
+        assert "TEMP B-TREE" not in plan
+        conn.close()
+
+    def test_hash_columns_stay_text(self, schema_db: Path) -> None:
+        """Chain hashes cover the previous hex string; the columns must not become BLOBs."""
+        conn = open_db(schema_db)
+        cols = {r["name"]: r["type"] for r in conn.execute("PRAGMA table_info(events)")}
+        assert cols["entry_hash"] == "TEXT"
+        assert cols["prev_hash"] == "TEXT"
+        conn.close()
+
+    def test_row_factory_returns_dict_like(self, schema_db: Path) -> None:
+        conn = open_db(schema_db)
         conn.execute("INSERT INTO meta(key, value) VALUES ('test_key', 'hello')")
         row = conn.execute("SELECT * FROM meta WHERE key = 'test_key'").fetchone()
         # sqlite3.Row supports key-based access
@@ -86,44 +144,44 @@ class TestOpenDb:
         conn.close()
 
 
+_SEED_FINDINGS = [("f-1", "TestBroker", "discovered", "2025-01-01", "2025-01-01")]
+_SEED_EVENTS = [("f-1", "discovered", "confirmed", "2025-01-01", "abc123", "", "")]
+
+
 class TestAppendOnlyTriggers:
     """Verify that the DB-level triggers block UPDATE/DELETE on events."""
 
-    def test_update_on_events_blocked(self, db_path: Path) -> None:
-        conn = open_db(db_path)
-        # Insert a finding + event so we have something to tamper with.
-        conn.execute(
+    @pytest.fixture()
+    def seeded_conn(self, schema_db: Path) -> sqlite3.Connection:  # type: ignore[misc]
+        """A finding + event to tamper with, written in one transaction."""
+        conn = open_db(schema_db)
+        conn.execute("BEGIN")
+        conn.executemany(
             "INSERT INTO findings(finding_id, broker_name, status, created_utc, updated_utc) "
-            "VALUES ('f-1', 'TestBroker', 'discovered', '2025-01-01', '2025-01-01')"
+            "VALUES (?, ?, ?, ?, ?)",
+            _SEED_FINDINGS,
         )
-        conn.execute(
+        conn.executemany(
             "INSERT INTO events(finding_id, from_status, to_status, at_utc, entry_hash, prev_hash, notes) "
-            "VALUES ('f-1', 'discovered', 'confirmed', '2025-01-01', 'abc123', '', '')"
+            "VALUES (?, ?, ?, ?, ?, ?, ?)",
+            _SEED_EVENTS,
         )
-        conn.commit()
-
-        with pytest.raises(sqlite3.IntegrityError, match="append-only"):
-            conn.execute("UPDATE events SET entry_hash = 'TAMPERED' WHERE seq = 1")
+        conn.execute("COMMIT")
+        yield conn  # type: ignore[misc]
         conn.close()
 
-    def test_delete_on_events_blocked(self, db_path: Path) -> None:
-        conn = open_db(db_path)
-        conn.execute(
-            "INSERT INTO findings(finding_id, broker_name, status, created_utc, updated_utc) "
-            "VALUES ('f-1', 'TestBroker', 'discovered', '2025-01-01', '2025-01-01')"
-        )
-        conn.execute(
-            "INSERT INTO events(finding_id, from_status, to_status, at_utc, entry_hash, prev_hash, notes) "
-            "VALUES ('f-1', 'discovered', 'confirmed', '2025-01-01', 'abc123', '', '')"
-        )
-        conn.commit()
+    def test_update_on_events_blocked(self, seeded_conn: sqlite3.Connection) -> None:
+        with pytest.raises(sqlite3.IntegrityError, match="append-only"):
+            seeded_conn.execute(
+                "UPDATE events SET entry_hash = 'TAMPERED' WHERE seq = 1"
+            )
 
+    def test_delete_on_events_blocked(self, seeded_conn: sqlite3.Connection) -> None:
         with pytest.raises(sqlite3.IntegrityError, match="append-only"):
-            conn.execute("DELETE FROM events WHERE seq = 1")
-        conn.close()
+            seeded_conn.execute("DELETE FROM events WHERE seq = 1")
 
-    def test_triggers_exist_in_schema(self, db_path: Path) -> None:
-        conn = open_db(db_path)
+    def test_triggers_exist_in_schema(self, schema_db: Path) -> None:
+        conn = open_db(schema_db)
         triggers = {
             row[0]
             for row in conn.execute(
@@ -133,3 +191,53 @@ class TestAppendOnlyTriggers:
         assert "events_no_update" in triggers
         assert "events_no_delete" in triggers
         conn.close()
+
+
+class TestMigration:
+    """Databases created by older schema versions are upgraded in place."""
+
+    def test_v1_gains_hash_algo(self, db_path: Path) -> None:
+        old = sqlite3.connect(str(db_path))
+        old.executescript(
+            "CREATE TABLE events (seq INTEGER PRIMARY KEY AUTOINCREMENT, finding_id TEXT NOT NULL, "
+            "from_status TEXT NOT NULL, to_status TEXT NOT NULL, at_utc TEXT NOT NULL, "
+            "entry_hash TEXT NOT NULL, prev_hash TEXT NOT NULL DEFAULT '', notes TEXT NOT NULL DEFAULT '');"
+            "CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);"
+            "INSERT INTO meta VALUES ('schema_version', '1');"
+            "INSERT INTO events(finding_id, from_status, to_status, at_utc, entry_hash) "
+            "VALUES ('f-1', 'discovered', 'confirmed', '2025-01-01', 'abc123');"
+        )
+        old.close()
+
+        conn = open_db(db_path)
+        row = conn.execute("SELECT hash_algo FROM events WHERE seq = 1").fetchone()
+        assert row["hash_algo"] == "sha256"
+        version = conn.execute(
+            "SELECT value FROM meta WHERE key = 'schema_version'"
+        ).fetchone()
+        assert version["value"] == str(SCHEMA_VERSION)
+        assert conn.execute("PRAGMA user_version").fetchone()[0] == SCHEMA_VERSION
+        conn.close()
+
+    def test_v2_gains_created_index(self, db_path: Path) -> None:
+        conn = open_db(db_path)
+        conn.execute("DROP INDEX idx_findings_created")
+        conn.execute("PRAGMA user_version = 2")
+        conn.close()
+
+        conn = open_db(db_path)
+        names = {
+            r[0]
+            for r in conn.execute("SELECT name FROM sqlite_master WHERE type='index'")
+        }
+        assert "idx_findings_created" in names
+        conn.close()
+
+    def test_current_version_skips_ddl(self, schema_db: Path) -> None:
+        """Reopening an up-to-date database issues no CREATE statements."""
+        conn = open_db(schema_db)
+        statements: list[str] = []
+        conn.set_trace_callback(statements.append)
+        _apply_schema(conn)
+        assert not any("CREATE" in sql for sql in statements)
+        conn.close()
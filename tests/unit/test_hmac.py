@@ -6,6 +6,9 @@ import pytest
 
 from pgo.core.audit import compute_hmac
 
+# HMAC-SHA256(key=b"secret", msg=b"data"), computed independently.
+_SECRET_DATA_HMAC = "1b2c16b75bd2a870c114153ccda5bcfca63314bc722fa160d690de133ccbb9db"
+
 
 class TestComputeHmac:
     def test_returns_none_without_key(self, monkeypatch: pytest.MonkeyPatch) -> None:
@@ -17,13 +20,19 @@ class TestComputeHmac:
         sig = compute_hmac("test data")
         assert sig is not None
         assert len(sig) == 64
-        assert all(c in "0123456789abcdef" for c in sig)
+        assert set(sig) <= set("0123456789abcdef")
+
+    def test_known_answer(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv("PGO_VAULT_KEY", "secret")
+        assert compute_hmac("data") == _SECRET_DATA_HMAC
 
-    def test_deterministic(self, monkeypatch: pytest.MonkeyPatch) -> None:
+    def test_bytes_and_str_agree(self, monkeypatch: pytest.MonkeyPatch) -> None:
         monkeypatch.setenv("PGO_VAULT_KEY", "secret")
-        assert compute_hmac("data") == compute_hmac("data")
+        assert compute_hmac(b"data") == _SECRET_DATA_HMAC
 
-    def test_different_data_different_sig(self, monkeypatch: pytest.MonkeyPatch) -> None:
+    def test_different_data_different_sig(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
         monkeypatch.setenv("PGO_VAULT_KEY", "secret")
         assert compute_hmac("data1") != compute_hmac("data2")
 
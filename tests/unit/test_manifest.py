@@ -9,32 +9,41 @@ import pytest
 from pgo.core.errors import ManifestInvalid, ManifestNotFound, ManifestTooLarge
 from pgo.manifest import BrokerTarget, load_brokers_manifest
 
+_SHARED_MANIFESTS = {
+    "valid": "brokers:\n  - name: Acme\n    domain: acme.com\n",
+    "bare_list": "- name: Foo\n",
+    "empty": "",
+    "legacy": "- broker: OldBroker\n",
+}
+
+
+@pytest.fixture(scope="session")
+def manifests(tmp_path_factory: pytest.TempPathFactory) -> dict[str, Path]:
+    """Read-only manifests shared by the happy-path tests, written once."""
+    root = tmp_path_factory.mktemp("manifests")
+    paths = {}
+    for name, text in _SHARED_MANIFESTS.items():
+        paths[name] = root / f"{name}.yaml"
+        paths[name].write_text(text, encoding="utf-8")
+    return paths
+
 
 # ── Happy path ──────────────────────────────────────────────
-def test_load_valid_manifest(tmp_path: Path) -> None:
-    p = tmp_path / "m.yaml"
-    p.write_text(
-        "brokers:\n  - name: Acme\n    domain: acme.com\n",
-        encoding="utf-8",
-    )
-    result = load_brokers_manifest(p)
+def test_load_valid_manifest(manifests: dict[str, Path]) -> None:
+    result = load_brokers_manifest(manifests["valid"])
     assert len(result) == 1
     assert result[0].name == "Acme"
     assert result[0].domain == "acme.com"
 
 
-def test_load_bare_list(tmp_path: Path) -> None:
+def test_load_bare_list(manifests: dict[str, Path]) -> None:
     """Bare YAML list (no 'brokers' key) is accepted."""
-    p = tmp_path / "m.yaml"
-    p.write_text("- name: Foo\n", encoding="utf-8")
-    result = load_brokers_manifest(p)
+    result = load_brokers_manifest(manifests["bare_list"])
     assert len(result) == 1
 
 
-def test_load_empty_yaml(tmp_path: Path) -> None:
-    p = tmp_path / "m.yaml"
-    p.write_text("", encoding="utf-8")
-    assert load_brokers_manifest(p) == []
+def test_load_empty_yaml(manifests: dict[str, Path]) -> None:
+    assert load_brokers_manifest(manifests["empty"]) == []
 
 
 # ── Error cases ─────────────────────────────────────────────
@@ -57,6 +66,14 @@ def test_invalid_yaml(tmp_path: Path) -> None:
         load_brokers_manifest(p)
 
 
+def test_control_character_is_parse_error(tmp_path: Path) -> None:
+    """Valid UTF-8 the YAML reader refuses is a parse error, not an encoding one."""
+    p = tmp_path / "m.yaml"
+    p.write_bytes(b"- name: A\x07B\n")
+    with pytest.raises(ManifestInvalid, match="YAML parse error"):
+        load_brokers_manifest(p)
+
+
 def test_schema_violation_extra_field(tmp_path: Path) -> None:
     """extra=forbid rejects unknown keys."""
     p = tmp_path / "m.yaml"
@@ -72,12 +89,25 @@ def test_blank_name_rejected(tmp_path: Path) -> None:
         load_brokers_manifest(p)
 
 
+def test_error_names_offending_item(tmp_path: Path) -> None:
+    p = tmp_path / "m.yaml"
+    p.write_text("- name: A\n- name: B\n  bogus: 1\n", encoding="utf-8")
+    with pytest.raises(ManifestInvalid, match="manifest item #1:"):
+        load_brokers_manifest(p)
+
+
+@pytest.mark.parametrize("data", [b"- name: caf\xe9\n", "- name: x\n".encode("utf-16")])
+def test_non_utf8_rejected(tmp_path: Path, data: bytes) -> None:
+    p = tmp_path / "m.yaml"
+    p.write_bytes(data)
+    with pytest.raises(ManifestInvalid, match="not valid UTF-8"):
+        load_brokers_manifest(p)
+
+
 # ── Legacy compatibility ────────────────────────────────────
-def test_legacy_broker_key_mapped_to_name(tmp_path: Path) -> None:
+def test_legacy_broker_key_mapped_to_name(manifests: dict[str, Path]) -> None:
     """Old manifests with 'broker' instead of 'name' still work."""
-    p = tmp_path / "m.yaml"
-    p.write_text("- broker: OldBroker\n", encoding="utf-8")
-    result = load_brokers_manifest(p)
+    result = load_brokers_manifest(manifests["legacy"])
     assert result[0].name == "OldBroker"
 
 
@@ -86,3 +116,53 @@ def test_broker_target_is_frozen() -> None:
     b = BrokerTarget(name="Test")
     with pytest.raises(Exception):  # ValidationError for frozen model
         b.name = "Modified"  # type: ignore[misc]
+
+
+# ── Validated-manifest cache ───────────────────────────────
+def test_cache_hit_skips_parsing(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    from pgo import manifest
+
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    p = tmp_path / "m.yaml"
+    p.write_text(
+        "brokers:\n  - name: Acme\n    url: https://acme.example\n", encoding="utf-8"
+    )
+    first = load_brokers_manifest(p, use_cache=True)
+
+    def _fail(data: bytes) -> list[BrokerTarget]:
+        raise AssertionError("manifest re-parsed on a cache hit")
+
+    monkeypatch.setattr(manifest, "_parse_manifest", _fail)
+    monkeypatch.setattr(manifest, "_MEMO", {})  # force the on-disk path
+    assert load_brokers_manifest(p, use_cache=True) == first
+
+
+def test_cache_invalidated_by_content_change(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    p = tmp_path / "m.yaml"
+    p.write_text("- name: Foo\n", encoding="utf-8")
+    load_brokers_manifest(p, use_cache=True)
+    p.write_text("- name: Bar\n", encoding="utf-8")
+    assert [b.name for b in load_brokers_manifest(p, use_cache=True)] == ["Bar"]
+
+
+def test_memo_returns_fresh_list(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Unchanged bytes are served from memory; callers can't corrupt the memo."""
+    from pgo import manifest
+
+    p = tmp_path / "m.yaml"
+    p.write_text("- name: Memo\n", encoding="utf-8")
+    first = load_brokers_manifest(p)
+    first.clear()
+
+    def _fail(data: bytes) -> list[BrokerTarget]:
+        raise AssertionError("manifest re-parsed on a memo hit")
+
+    monkeypatch.setattr(manifest, "_parse_manifest", _fail)
+    assert [b.name for b in load_brokers_manifest(p)] == ["Memo"]
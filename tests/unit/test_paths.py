@@ -10,26 +10,29 @@ from pgo.core.errors import RepoRootNotFound
 from pgo.core.paths import find_repo_root
 
 
-def test_find_repo_root_from_root(tmp_path: Path) -> None:
+@pytest.fixture(scope="module")
+def fake_repo(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """One read-only repo layout (marker, src/pgo/core, manifests) for the lookup tests."""
+    root = tmp_path_factory.mktemp("repo")
+    (root / "pyproject.toml").touch()
+    (root / "src" / "pgo" / "core").mkdir(parents=True)
+    (root / "manifests").mkdir()
+    return root
+
+
+def test_find_repo_root_from_root(fake_repo: Path) -> None:
     """When cwd IS the root, return it."""
-    (tmp_path / "pyproject.toml").touch()
-    assert find_repo_root(start=tmp_path) == tmp_path
+    assert find_repo_root(start=fake_repo) == fake_repo
 
 
-def test_find_repo_root_from_subdirectory(tmp_path: Path) -> None:
+def test_find_repo_root_from_subdirectory(fake_repo: Path) -> None:
     """Walking up from a deep subdirectory must find the marker."""
-    (tmp_path / "pyproject.toml").touch()
-    deep = tmp_path / "src" / "pgo" / "core"
-    deep.mkdir(parents=True)
-    assert find_repo_root(start=deep) == tmp_path
+    assert find_repo_root(start=fake_repo / "src" / "pgo" / "core") == fake_repo
 
 
-def test_find_repo_root_from_manifests(tmp_path: Path) -> None:
+def test_find_repo_root_from_manifests(fake_repo: Path) -> None:
     """Simulates running `pgo` from the manifests/ subdirectory."""
-    (tmp_path / "pyproject.toml").touch()
-    manifests = tmp_path / "manifests"
-    manifests.mkdir()
-    assert find_repo_root(start=manifests) == tmp_path
+    assert find_repo_root(start=fake_repo / "manifests") == fake_repo
 
 
 def test_find_repo_root_raises_when_missing(tmp_path: Path) -> None:
@@ -40,9 +43,36 @@ def test_find_repo_root_raises_when_missing(tmp_path: Path) -> None:
         find_repo_root(start=isolated)
 
 
-def test_find_repo_root_resolved_is_absolute(tmp_path: Path) -> None:
+def test_find_repo_root_resolved_is_absolute(fake_repo: Path) -> None:
     """Result is always an absolute, resolved path."""
-    (tmp_path / "pyproject.toml").touch()
-    result = find_repo_root(start=tmp_path)
+    result = find_repo_root(start=fake_repo / "src" / ".." / "manifests")
     assert result.is_absolute()
     assert result == result.resolve()
+
+
+def test_find_repo_root_ignores_marker_directory(tmp_path: Path) -> None:
+    """Only a *file* named pyproject.toml marks the root."""
+    (tmp_path / "pyproject.toml").touch()
+    inner = tmp_path / "inner"
+    (inner / "pyproject.toml").mkdir(parents=True)
+    assert find_repo_root(start=inner) == tmp_path
+
+
+def test_repo_root_memoised_per_cwd(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """repo_root() walks once per cwd and follows a chdir."""
+    from pgo.core import paths
+
+    a, b = tmp_path / "a", tmp_path / "b"
+    for root in (a, b):
+        root.mkdir()
+        (root / "pyproject.toml").touch()
+
+    monkeypatch.chdir(a)
+    assert paths.repo_root() == a.resolve()
+    (a / "pyproject.toml").unlink()
+    assert paths.repo_root() == a.resolve()  # memoised for this cwd
+
+    monkeypatch.chdir(b)
+    assert paths.repo_root() == b.resolve()
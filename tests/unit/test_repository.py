@@ -3,55 +3,96 @@
 from __future__ import annotations
 
 import sqlite3
-from pathlib import Path
 
 import pytest
 
-from pgo.core.db import open_db
+from pgo.core.db import _apply_schema
 from pgo.core.errors import StateTransitionInvalid
 from pgo.core.repository import (
     Finding,
+    count_findings,
     create_finding,
     get_finding,
+    iter_findings,
     list_findings,
     transition_finding,
 )
 from pgo.core.models import FindingStatus
 
 
+@pytest.fixture(scope="session")
+def template() -> sqlite3.Connection:  # type: ignore[misc]
+    """An in-memory DB with the production schema, built once per session.
+
+    Nothing here depends on the file, WAL or durability pragmas (test_db
+    covers those), so skip the disk entirely.
+    """
+    t = sqlite3.connect(":memory:", isolation_level=None)
+    t.row_factory = sqlite3.Row
+    _apply_schema(t)
+    yield t  # type: ignore[misc]
+    t.close()
+
+
 @pytest.fixture()
-def conn(tmp_path: Path) -> sqlite3.Connection:  # type: ignore[misc]
-    """Yield a fresh in-memory-like DB connection."""
-    c = open_db(tmp_path / "test.db")
+def conn(template: sqlite3.Connection) -> sqlite3.Connection:  # type: ignore[misc]
+    """Yield a fresh page-for-page copy of the template."""
+    c = sqlite3.connect(":memory:", isolation_level=None)
+    template.backup(c)
+    c.row_factory = sqlite3.Row
+    c.execute("PRAGMA foreign_keys=ON")
     yield c  # type: ignore[misc]
     c.close()
 
 
+def _seed_at_state(
+    conn: sqlite3.Connection, finding_id: str, status: FindingStatus
+) -> None:
+    """Create a finding directly in *status*, skipping the transitions before it.
+
+    For setup only; the transition under test still goes through
+    ``transition_finding``.  ``test_full_happy_path`` covers the real chain.
+    """
+    create_finding(conn, finding_id=finding_id, broker_name="Seed")
+    conn.execute(
+        "UPDATE findings SET status = ? WHERE finding_id = ?",
+        (status.value, finding_id),
+    )
+
+
 # ── create_finding ──────────────────────────────────────────
 class TestCreateFinding:
-    def test_creates_in_discovered(self, conn: sqlite3.Connection) -> None:
-        f = create_finding(conn, finding_id="f-1", broker_name="BeenVerified")
+    @pytest.mark.parametrize(
+        ("fid", "broker", "url"),
+        [
+            ("f-1", "BeenVerified", None),
+            ("f-2", "Spokeo", "https://spokeo.com/remove"),
+            ("f-3", "WhitePages", None),
+        ],
+    )
+    def test_creates(
+        self, conn: sqlite3.Connection, fid: str, broker: str, url: str | None
+    ) -> None:
+        f = create_finding(conn, finding_id=fid, broker_name=broker, url=url)
         assert f.status == FindingStatus.DISCOVERED
-        assert f.finding_id == "f-1"
-        assert f.broker_name == "BeenVerified"
-
-    def test_creates_with_url(self, conn: sqlite3.Connection) -> None:
-        f = create_finding(conn, finding_id="f-2", broker_name="Spokeo", url="https://spokeo.com/remove")
-        assert f.url == "https://spokeo.com/remove"
-
-    def test_creates_without_url(self, conn: sqlite3.Connection) -> None:
-        f = create_finding(conn, finding_id="f-3", broker_name="WhitePages")
-        assert f.url is None
+        assert f.finding_id == fid
+        assert f.broker_name == broker
+        assert f.url == url
+        assert f.created_utc != ""
+        assert f.updated_utc != ""
 
     def test_duplicate_id_raises(self, conn: sqlite3.Connection) -> None:
         create_finding(conn, finding_id="f-dup", broker_name="A")
         with pytest.raises(Exception):  # sqlite3.IntegrityError
             create_finding(conn, finding_id="f-dup", broker_name="B")
 
-    def test_timestamps_are_set(self, conn: sqlite3.Connection) -> None:
-        f = create_finding(conn, finding_id="f-ts", broker_name="X")
-        assert f.created_utc != ""
-        assert f.updated_utc != ""
+    def test_joins_caller_transaction(self, conn: sqlite3.Connection) -> None:
+        """Writes don't commit on their own inside a caller's transaction."""
+        conn.execute("BEGIN")
+        create_finding(conn, finding_id="f-txn", broker_name="X")
+        assert conn.in_transaction
+        conn.rollback()
+        assert get_finding(conn, "f-txn") is None
 
 
 # ── get_finding ─────────────────────────────────────────────
@@ -65,6 +106,14 @@ class TestGetFinding:
     def test_not_found(self, conn: sqlite3.Connection) -> None:
         assert get_finding(conn, "nonexistent") is None
 
+    def test_unknown_stored_status_is_value_error(
+        self, conn: sqlite3.Connection
+    ) -> None:
+        create_finding(conn, finding_id="f-g2", broker_name="Intelius")
+        conn.execute("UPDATE findings SET status = 'bogus' WHERE finding_id = 'f-g2'")
+        with pytest.raises(ValueError, match="'bogus'"):
+            get_finding(conn, "f-g2")
+
 
 # ── list_findings ───────────────────────────────────────────
 class TestListFindings:
@@ -83,6 +132,19 @@ class TestListFindings:
         result = list_findings(conn)
         assert isinstance(result[0], Finding)
 
+    def test_iter_findings_limit_and_batches(self, conn: sqlite3.Connection) -> None:
+        for i in range(5):
+            create_finding(conn, finding_id=f"f-{i}", broker_name="B")
+        assert [f.finding_id for f in iter_findings(conn, batch_size=2)] == [
+            f"f-{i}" for i in range(5)
+        ]
+        assert [f.finding_id for f in iter_findings(conn, limit=3)] == [
+            "f-0",
+            "f-1",
+            "f-2",
+        ]
+        assert count_findings(conn) == 5
+
 
 # ── transition_finding ──────────────────────────────────────
 class TestTransitionFinding:
@@ -97,8 +159,7 @@ class TestTransitionFinding:
         assert f.status == FindingStatus.CONFIRMED
 
     def test_confirmed_to_submitted(self, conn: sqlite3.Connection) -> None:
-        create_finding(conn, finding_id="f-t2", broker_name="T2")
-        transition_finding(conn, "f-t2", FindingStatus.CONFIRMED)
+        _seed_at_state(conn, "f-t2", FindingStatus.CONFIRMED)
         event = transition_finding(conn, "f-t2", FindingStatus.SUBMITTED)
         assert event.from_status == FindingStatus.CONFIRMED
         assert event.to_status == FindingStatus.SUBMITTED
@@ -125,10 +186,7 @@ class TestTransitionFinding:
 
     def test_resurfaced_resubmit(self, conn: sqlite3.Connection) -> None:
         """VERIFIED → RESURFACED → SUBMITTED (re-submit cycle)."""
-        create_finding(conn, finding_id="f-re", broker_name="Re")
-        transition_finding(conn, "f-re", FindingStatus.CONFIRMED)
-        transition_finding(conn, "f-re", FindingStatus.SUBMITTED)
-        transition_finding(conn, "f-re", FindingStatus.VERIFIED)
+        _seed_at_state(conn, "f-re", FindingStatus.VERIFIED)
         transition_finding(conn, "f-re", FindingStatus.RESURFACED)
         event = transition_finding(conn, "f-re", FindingStatus.SUBMITTED)
         assert event.from_status == FindingStatus.RESURFACED
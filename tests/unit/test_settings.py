@@ -37,6 +37,22 @@ def test_settings_ensure_dirs_creates_directories(tmp_path: Path) -> None:
     assert s.exports_dir is not None and s.exports_dir.is_dir()
 
 
+def test_settings_ensure_dirs_rehardens_only_when_needed(tmp_path: Path) -> None:
+    """Existing owner-only dirs are left alone; loosened ones are fixed."""
+    import stat
+    from unittest.mock import patch
+
+    s = Settings(repo_root=tmp_path)
+    s.ensure_dirs()
+    assert s.vault_dir is not None
+    s.vault_dir.chmod(0o755)
+
+    with patch.object(Path, "mkdir", wraps=Path.mkdir, autospec=True) as mkdir:
+        s.ensure_dirs()
+    assert [c.args[0] for c in mkdir.call_args_list] == [s.vault_dir]
+    assert stat.S_IMODE(s.vault_dir.stat().st_mode) == 0o700
+
+
 def test_settings_override_individual_dir(tmp_path: Path) -> None:
     """Explicit vault_dir overrides the default derivation."""
     custom_vault = tmp_path / "my_vault"
@@ -0,0 +1,81 @@
+"""Tests for pgo.core.settings_cache — on-disk settings resolution cache."""
+
+from __future__ import annotations
+
+from dataclasses import fields
+from pathlib import Path
+
+import pytest
+
+from pgo.core.settings import Settings
+from pgo.core.settings_cache import SettingsSnapshot, cache_path, load_settings
+
+
+@pytest.fixture()
+def repo(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    root = tmp_path / "repo"
+    root.mkdir()
+    (root / "pyproject.toml").touch()
+    monkeypatch.chdir(root)
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    for var in ("PGO_REPO_ROOT", "PGO_SETTINGS_CACHE", "PGO_VAULT_KEY"):
+        monkeypatch.delenv(var, raising=False)
+    return root
+
+
+def test_snapshot_mirrors_settings_fields() -> None:
+    """Every Settings field must survive a round-trip through the cache."""
+    assert {f.name for f in fields(SettingsSnapshot)} == set(Settings.model_fields)
+
+
+def test_miss_then_hit(repo: Path) -> None:
+    first = load_settings(log_level="INFO")
+    assert isinstance(first, Settings)
+    assert cache_path().exists()
+
+    second = load_settings(log_level="INFO")
+    assert isinstance(second, SettingsSnapshot)
+    assert second.repo_root == repo.resolve()
+    assert second.db_path == first.db_path
+    assert second.manifest_path == first.manifest_path
+
+
+def test_overrides_and_env_change_invalidate(
+    repo: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    load_settings(log_level="INFO")
+    assert isinstance(load_settings(log_level="DEBUG"), Settings)
+
+    monkeypatch.setenv("PGO_DB_FILENAME", "other.db")
+    s = load_settings(log_level="DEBUG")
+    assert isinstance(s, Settings)
+    assert s.db_path.name == "other.db"
+
+
+def test_secrets_not_written(repo: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("PGO_VAULT_KEY", "super-secret-value")
+    load_settings()
+    assert "super-secret-value" not in cache_path().read_text()
+
+
+def test_vault_key_not_in_cache_key(
+    repo: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Changing the vault passphrase neither invalidates nor is hashed into the key."""
+    monkeypatch.setenv("PGO_VAULT_KEY", "first-secret")
+    load_settings()
+    monkeypatch.setenv("PGO_VAULT_KEY", "second-secret")
+    assert isinstance(load_settings(), SettingsSnapshot)
+
+
+def test_corrupt_cache_is_a_miss(repo: Path) -> None:
+    load_settings()
+    cache_path().write_text("{not json")
+    assert isinstance(load_settings(), Settings)
+    assert isinstance(load_settings(), SettingsSnapshot)
+
+
+def test_bypass(repo: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("PGO_SETTINGS_CACHE", "0")
+    load_settings()
+    assert not cache_path().exists()
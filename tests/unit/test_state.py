@@ -8,21 +8,35 @@ from pgo.core.errors import StateTransitionInvalid
 from pgo.core.models import FindingStatus
 from pgo.core.state import ALLOWED_TRANSITIONS, can_transition, transition
 
+_Pair = tuple[FindingStatus, FindingStatus]
 
-# ── Valid transitions ───────────────────────────────────────
-@pytest.mark.parametrize(
-    "from_s, to_s",
-    [
-        (FindingStatus.DISCOVERED, FindingStatus.CONFIRMED),
-        (FindingStatus.CONFIRMED, FindingStatus.SUBMITTED),
-        (FindingStatus.SUBMITTED, FindingStatus.PENDING),
-        (FindingStatus.SUBMITTED, FindingStatus.VERIFIED),
-        (FindingStatus.PENDING, FindingStatus.VERIFIED),
-        (FindingStatus.PENDING, FindingStatus.RESURFACED),
-        (FindingStatus.VERIFIED, FindingStatus.RESURFACED),
-        (FindingStatus.RESURFACED, FindingStatus.SUBMITTED),
-    ],
+_VALID: tuple[_Pair, ...] = (
+    (FindingStatus.DISCOVERED, FindingStatus.CONFIRMED),
+    (FindingStatus.CONFIRMED, FindingStatus.SUBMITTED),
+    (FindingStatus.SUBMITTED, FindingStatus.PENDING),
+    (FindingStatus.SUBMITTED, FindingStatus.VERIFIED),
+    (FindingStatus.PENDING, FindingStatus.VERIFIED),
+    (FindingStatus.PENDING, FindingStatus.RESURFACED),
+    (FindingStatus.VERIFIED, FindingStatus.RESURFACED),
+    (FindingStatus.RESURFACED, FindingStatus.SUBMITTED),
+)
+
+_INVALID: tuple[_Pair, ...] = (
+    (FindingStatus.DISCOVERED, FindingStatus.VERIFIED),
+    (FindingStatus.DISCOVERED, FindingStatus.SUBMITTED),
+    (FindingStatus.CONFIRMED, FindingStatus.VERIFIED),
+    (FindingStatus.VERIFIED, FindingStatus.DISCOVERED),
+    (FindingStatus.PENDING, FindingStatus.DISCOVERED),
 )
+
+
+def _ids(pairs: tuple[_Pair, ...]) -> list[str]:
+    """``DISCOVERED->CONFIRMED`` instead of ``from_s0-to_s0`` in reports."""
+    return [f"{a.name}->{b.name}" for a, b in pairs]
+
+
+# ── Valid transitions ───────────────────────────────────────
+@pytest.mark.parametrize(("from_s", "to_s"), _VALID, ids=_ids(_VALID))
 def test_valid_transitions(from_s: FindingStatus, to_s: FindingStatus) -> None:
     assert can_transition(from_s, to_s) is True
     event = transition("f-1", from_s, to_s)
@@ -33,16 +47,7 @@ def test_valid_transitions(from_s: FindingStatus, to_s: FindingStatus) -> None:
 
 
 # ── Invalid transitions ────────────────────────────────────
-@pytest.mark.parametrize(
-    "from_s, to_s",
-    [
-        (FindingStatus.DISCOVERED, FindingStatus.VERIFIED),
-        (FindingStatus.DISCOVERED, FindingStatus.SUBMITTED),
-        (FindingStatus.CONFIRMED, FindingStatus.VERIFIED),
-        (FindingStatus.VERIFIED, FindingStatus.DISCOVERED),
-        (FindingStatus.PENDING, FindingStatus.DISCOVERED),
-    ],
-)
+@pytest.mark.parametrize(("from_s", "to_s"), _INVALID, ids=_ids(_INVALID))
 def test_invalid_transitions(from_s: FindingStatus, to_s: FindingStatus) -> None:
     assert can_transition(from_s, to_s) is False
     with pytest.raises(StateTransitionInvalid):
@@ -52,4 +57,12 @@ def test_invalid_transitions(from_s: FindingStatus, to_s: FindingStatus) -> None
 # ── Coverage: every status has an entry in ALLOWED_TRANSITIONS ──
 def test_all_statuses_have_transition_rules() -> None:
     for status in FindingStatus:
-        assert status in ALLOWED_TRANSITIONS, f"{status} missing from ALLOWED_TRANSITIONS"
+        assert status in ALLOWED_TRANSITIONS, (
+            f"{status} missing from ALLOWED_TRANSITIONS"
+        )
+
+
+def test_can_transition_matches_table() -> None:
+    for src in FindingStatus:
+        for dst in FindingStatus:
+            assert can_transition(src, dst) is (dst in ALLOWED_TRANSITIONS[src])
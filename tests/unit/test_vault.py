@@ -15,6 +15,8 @@ Zero Trust tests:
 
 from __future__ import annotations
 
+import os
+import shutil
 import stat
 from pathlib import Path
 from unittest.mock import patch
@@ -28,12 +30,15 @@ cryptography = pytest.importorskip("cryptography")
 
 from pgo.modules.vault import (  # noqa: E402
     _HEADER_BYTES,
+    VaultWriter,
     _derive_key,
     _safe_vault_path,
     compute_integrity_hash,
     harden_directory_permissions,
     retrieve_evidence,
+    retrieve_evidence_batch,
     store_evidence,
+    store_evidence_batch,
 )
 
 
@@ -50,6 +55,12 @@ def vault_dir(tmp_path: Path) -> Path:
     return d
 
 
+def _read_stored(vault_dir: Path, finding_id: str) -> bytes:
+    """The raw (encrypted) bytes of a finding's default evidence file."""
+    with open(os.path.join(vault_dir, finding_id, "evidence.bin"), "rb") as fh:
+        return fh.read()
+
+
 # ── Round-trip ─────────────────────────────────────────────
 class TestStoreRetrieve:
     def test_round_trip(self, vault_dir: Path) -> None:
@@ -72,10 +83,29 @@ class TestStoreRetrieve:
     def test_different_data_different_hash(self) -> None:
         assert compute_integrity_hash(b"a") != compute_integrity_hash(b"b")
 
+    def test_store_from_path(self, vault_dir: Path, tmp_path: Path) -> None:
+        """A Path is read and stored; same result as passing its bytes."""
+        src = tmp_path / "report.pdf"
+        src.write_bytes(b"%PDF" * 50_000)
+        meta = store_evidence(vault_dir, "f-path", src)
+        assert meta["integrity_hash"] == compute_integrity_hash(src.read_bytes())
+        assert retrieve_evidence(vault_dir, "f-path") == src.read_bytes()
+
+    def test_store_from_buffer_views(self, vault_dir: Path) -> None:
+        """bytearray and memoryview (any item format) store their raw bytes."""
+        data = bytes(range(256)) * 16
+        wide = memoryview(data).cast("I")  # len() counts 4-byte items
+        for i, buf in enumerate((bytearray(data), memoryview(data), wide)):
+            meta = store_evidence(vault_dir, f"f-buf{i}", buf)
+            assert meta["integrity_hash"] == compute_integrity_hash(data)
+            assert retrieve_evidence(vault_dir, f"f-buf{i}") == data
+
 
 # ── Error cases ────────────────────────────────────────────
 class TestVaultErrors:
-    def test_missing_key(self, vault_dir: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    def test_missing_key(
+        self, vault_dir: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
         monkeypatch.delenv("PGO_VAULT_KEY", raising=False)
         with pytest.raises(VaultKeyMissing):
             store_evidence(vault_dir, "f-1", b"data")
@@ -85,11 +115,33 @@ class TestVaultErrors:
             store_evidence(vault_dir, "f-1", b"")
 
     def test_oversized_evidence(self, vault_dir: Path) -> None:
-        big = b"x" * (50 * 1024 * 1024 + 1)
+        big = bytes(50 * 1024 * 1024 + 1)  # calloc'd: no pages touched
         with pytest.raises(VaultWriteFailed, match="too large"):
             store_evidence(vault_dir, "f-1", big)
 
-    def test_wrong_key_fails_decrypt(self, vault_dir: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    def test_oversized_path_rejected_before_read(
+        self, vault_dir: Path, tmp_path: Path
+    ) -> None:
+        big = tmp_path / "big.bin"
+        with big.open("wb") as fh:
+            fh.truncate(50 * 1024 * 1024 + 1)  # sparse: nothing written
+        with pytest.raises(VaultWriteFailed, match="too large"):
+            store_evidence(vault_dir, "f-1", big)
+
+    def test_oversized_view_counts_bytes(self, vault_dir: Path) -> None:
+        """The limit applies to bytes, not to a wide view's item count."""
+        wide = memoryview(bytes(50 * 1024 * 1024 + 4)).cast("I")
+        with pytest.raises(VaultWriteFailed, match="too large"):
+            store_evidence(vault_dir, "f-1", wide)
+
+    def test_strided_view_rejected(self, vault_dir: Path) -> None:
+        strided = memoryview(b"evidence-bytes")[::2]
+        with pytest.raises(VaultWriteFailed, match="contiguous"):
+            store_evidence(vault_dir, "f-1", strided)
+
+    def test_wrong_key_fails_decrypt(
+        self, vault_dir: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
         data = b"secret evidence"
         store_evidence(vault_dir, "f-1", data)
         # Change key for retrieval.
@@ -101,6 +153,14 @@ class TestVaultErrors:
         with pytest.raises(FileNotFoundError):
             retrieve_evidence(vault_dir, "nonexistent")
 
+    @pytest.mark.parametrize("size", [0, _HEADER_BYTES])
+    def test_empty_or_truncated_file(self, vault_dir: Path, size: int) -> None:
+        """Short files fail cleanly (an empty file cannot be memory-mapped)."""
+        (vault_dir / "f-short").mkdir()
+        (vault_dir / "f-short" / "evidence.bin").write_bytes(b"\0" * size)
+        with pytest.raises(VaultWriteFailed, match="too short"):
+            retrieve_evidence(vault_dir, "f-short")
+
     def test_integrity_mismatch(self, vault_dir: Path) -> None:
         store_evidence(vault_dir, "f-1", b"data")
         with pytest.raises(VaultWriteFailed, match="Integrity check"):
@@ -111,8 +171,7 @@ class TestVaultErrors:
 class TestPermissions:
     def test_stored_file_owner_only(self, vault_dir: Path) -> None:
         store_evidence(vault_dir, "f-perms", b"data")
-        path = vault_dir / "f-perms" / "evidence.bin"
-        mode = path.stat().st_mode
+        mode = os.stat(os.path.join(vault_dir, "f-perms", "evidence.bin")).st_mode
         # Owner read+write only.
         assert mode & stat.S_IRUSR
         assert mode & stat.S_IWUSR
@@ -122,6 +181,29 @@ class TestPermissions:
         assert not (mode & stat.S_IROTH)
         assert not (mode & stat.S_IWOTH)
 
+    def test_finding_dir_created_owner_only(self, vault_dir: Path) -> None:
+        store_evidence(vault_dir, "f-dir", b"data")
+        mode = (vault_dir / "f-dir").stat().st_mode
+        assert not (mode & (stat.S_IRWXG | stat.S_IRWXO))
+
+    def test_existing_finding_dir_hardened(self, vault_dir: Path) -> None:
+        """A pre-existing finding directory with loose permissions is tightened."""
+        d = vault_dir / "f-loose"
+        d.mkdir()
+        d.chmod(0o755)
+        store_evidence(vault_dir, "f-loose", b"data")
+        assert stat.S_IMODE(d.stat().st_mode) == stat.S_IRWXU
+
+    def test_existing_finding_dir_not_recreated(self, vault_dir: Path) -> None:
+        """Repeat writes to a finding skip mkdir; a removed directory comes back."""
+        store_evidence(vault_dir, "f-again", b"one")
+        with patch.object(Path, "mkdir", side_effect=AssertionError("mkdir called")):
+            store_evidence(vault_dir, "f-again", b"two")
+
+        shutil.rmtree(vault_dir / "f-again")
+        store_evidence(vault_dir, "f-again", b"three")
+        assert retrieve_evidence(vault_dir, "f-again") == b"three"
+
     def test_harden_directory(self, tmp_path: Path) -> None:
         d = tmp_path / "secure"
         d.mkdir()
@@ -131,6 +213,18 @@ class TestPermissions:
         assert not (mode & stat.S_IRWXG)  # No group access.
         assert not (mode & stat.S_IRWXO)  # No other access.
 
+    def test_harden_skips_chmod_when_already_owner_only(self, tmp_path: Path) -> None:
+        d = tmp_path / "secure"
+        d.mkdir()
+        d.chmod(0o755)
+        with patch.object(
+            Path, "chmod", autospec=True, side_effect=Path.chmod
+        ) as chmod:
+            harden_directory_permissions(d)
+            harden_directory_permissions(d)
+        assert chmod.call_count == 1
+        assert stat.S_IMODE(d.stat().st_mode) == stat.S_IRWXU
+
 
 # ── AES-256-GCM specific tests ─────────────────────────────
 class TestAES256GCM:
@@ -138,7 +232,7 @@ class TestAES256GCM:
         """Verify output is AES-256-GCM wire format, not Fernet."""
         data = b"evidence bytes"
         store_evidence(vault_dir, "f-gcm", data)
-        raw = (vault_dir / "f-gcm" / "evidence.bin").read_bytes()
+        raw = _read_stored(vault_dir, "f-gcm")
         # Fernet tokens start with 0x80 version byte; GCM does not have that prefix.
         # Our wire format: salt(16) + nonce(12) + ciphertext+tag
         assert len(raw) > _HEADER_BYTES
@@ -147,13 +241,15 @@ class TestAES256GCM:
         with pytest.raises(UnicodeDecodeError):
             raw.decode("ascii")
 
-    def test_different_encryptions_produce_different_ciphertext(self, vault_dir: Path) -> None:
+    def test_different_encryptions_produce_different_ciphertext(
+        self, vault_dir: Path
+    ) -> None:
         """Each encryption uses a random salt + nonce, so ciphertext differs."""
         data = b"same data"
         store_evidence(vault_dir, "f-r1", data)
         store_evidence(vault_dir, "f-r2", data)
-        ct1 = (vault_dir / "f-r1" / "evidence.bin").read_bytes()
-        ct2 = (vault_dir / "f-r2" / "evidence.bin").read_bytes()
+        ct1 = _read_stored(vault_dir, "f-r1")
+        ct2 = _read_stored(vault_dir, "f-r2")
         assert ct1 != ct2  # Different salt+nonce = different ciphertext.
 
 
@@ -177,6 +273,16 @@ class TestKeyDerivation:
         k2 = _derive_key("pass2", salt)
         assert k1 != k2
 
+    def test_round_trip_derives_once(self, vault_dir: Path) -> None:
+        """Retrieving what this process just stored reuses the derived key."""
+        import hashlib
+
+        store_evidence(vault_dir, "f-kdf", b"evidence")
+        with patch.object(
+            hashlib, "pbkdf2_hmac", side_effect=AssertionError("re-derived")
+        ):
+            assert retrieve_evidence(vault_dir, "f-kdf") == b"evidence"
+
 
 # ── Path traversal defence tests ───────────────────────────
 class TestPathTraversal:
@@ -193,6 +299,12 @@ class TestPathTraversal:
         with pytest.raises(VaultPathTraversal):
             _safe_vault_path(vault_dir, "/etc/passwd")
 
+    def test_pre_resolved_root_still_checked(self, vault_dir: Path) -> None:
+        with pytest.raises(VaultPathTraversal):
+            _safe_vault_path(
+                vault_dir, "f-1", "../../x", vault_root=vault_dir.resolve()
+            )
+
     def test_allows_normal_finding_id(self, vault_dir: Path) -> None:
         path = _safe_vault_path(vault_dir, "finding-123", "evidence.bin")
         assert path.is_relative_to(vault_dir.resolve())
@@ -240,6 +352,19 @@ class TestAtomicWrite:
             tmp_files = list(finding_dir.glob(".evidence_*.tmp"))
             assert tmp_files == [], f"Temp files left behind after failure: {tmp_files}"
 
+    def test_short_writes_are_completed(self, vault_dir: Path) -> None:
+        """Short (gather) writes resume where they stopped, across part boundaries."""
+        real_write = os.write
+        name = "writev" if hasattr(os, "writev") else "write"
+
+        def _short(fd: int, buf: object) -> int:
+            first = buf[0] if isinstance(buf, list) else buf
+            return real_write(fd, first[:7])  # type: ignore[index]
+
+        with patch(f"pgo.modules.vault.os.{name}", side_effect=_short):
+            store_evidence(vault_dir, "f-short", b"x" * 100)
+        assert retrieve_evidence(vault_dir, "f-short") == b"x" * 100
+
     def test_target_untouched_on_write_failure(self, vault_dir: Path) -> None:
         """If a second write fails, the original file survives intact."""
         store_evidence(vault_dir, "f-survive", b"original")
@@ -248,3 +373,62 @@ class TestAtomicWrite:
                 store_evidence(vault_dir, "f-survive", b"should-not-land")
         recovered = retrieve_evidence(vault_dir, "f-survive")
         assert recovered == b"original"
+
+
+# ── Batched writes ─────────────────────────────────────────
+class TestVaultWriter:
+    def test_one_dir_fsync_per_finding(self, vault_dir: Path) -> None:
+        """Directory fsyncs are deferred to exit, once per directory touched."""
+        with (
+            patch("pgo.modules.vault._fsync_dir") as fsync_dir,
+            VaultWriter(vault_dir) as vw,
+        ):
+            for i in range(5):
+                vw.store("f-a", b"a", filename=f"e{i}.bin")
+            vw.store("f-b", b"b")
+            assert fsync_dir.call_count == 0
+        assert sorted(c.args[0].name for c in fsync_dir.call_args_list) == [
+            "f-a",
+            "f-b",
+        ]
+        assert retrieve_evidence(vault_dir, "f-a", filename="e4.bin") == b"a"
+
+    def test_flushes_on_error(self, vault_dir: Path) -> None:
+        """Files already renamed into place still get their directory fsync."""
+        with (
+            patch("pgo.modules.vault._fsync_dir") as fsync_dir,
+            pytest.raises(VaultWriteFailed),
+            VaultWriter(vault_dir) as vw,
+        ):
+            vw.store("f-ok", b"data")
+            vw.store("f-bad", b"")
+        assert [c.args[0].name for c in fsync_dir.call_args_list] == ["f-ok"]
+
+    def test_batch_preserves_order(self, vault_dir: Path) -> None:
+        jobs = [(f"f-{i}", f"data-{i}".encode(), "e.bin") for i in range(6)]
+        metas = store_evidence_batch(vault_dir, jobs, max_workers=3)
+        assert [m["finding_id"] for m in metas] == [j[0] for j in jobs]
+        for finding_id, data, _ in jobs:
+            assert retrieve_evidence(vault_dir, finding_id, filename="e.bin") == data
+
+    def test_batch_raises_first_failure(self, vault_dir: Path) -> None:
+        jobs = [("f-ok", b"data", "e.bin"), ("f-empty", b"", "e.bin")]
+        with pytest.raises(VaultWriteFailed, match="empty"):
+            store_evidence_batch(vault_dir, jobs)
+        assert retrieve_evidence(vault_dir, "f-ok", filename="e.bin") == b"data"
+
+    def test_retrieve_batch_round_trip(self, vault_dir: Path) -> None:
+        jobs = [(f"f-{i}", f"data-{i}".encode(), "e.bin") for i in range(6)]
+        metas = store_evidence_batch(vault_dir, jobs, max_workers=3)
+        got = retrieve_evidence_batch(
+            vault_dir,
+            [(m["finding_id"], "e.bin", m["integrity_hash"]) for m in reversed(metas)],
+            max_workers=3,
+        )
+        assert got == [data for _, data, _ in reversed(jobs)]
+
+    def test_retrieve_batch_raises_first_failure(self, vault_dir: Path) -> None:
+        store_evidence(vault_dir, "f-ok", b"data")
+        jobs = [("f-ok", "evidence.bin", None), ("f-missing", "evidence.bin", None)]
+        with pytest.raises(FileNotFoundError):
+            retrieve_evidence_batch(vault_dir, jobs)
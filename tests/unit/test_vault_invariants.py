@@ -12,14 +12,21 @@ from __future__ import annotations
 
 from pathlib import Path
 
+import pytest
 
-_VAULT_SRC = Path("src/pgo/modules/vault.py").read_text(encoding="utf-8")
+_VAULT_PY = Path(__file__).resolve().parents[2] / "src" / "pgo" / "modules" / "vault.py"
+
+
+@pytest.fixture(scope="session")
+def vault_src() -> str:
+    """vault.py's source, read once per session (not at collection time)."""
+    return _VAULT_PY.read_text(encoding="utf-8")
 
 
 class TestVaultSourceInvariants:
     """Guard against regressions to unsafe I/O patterns."""
 
-    def test_no_direct_write_bytes(self) -> None:
+    def test_no_direct_write_bytes(self, vault_src: str) -> None:
         """vault.py must NOT use Path.write_bytes() for evidence storage.
 
         Direct write_bytes() is non-atomic: a crash mid-write corrupts the
@@ -27,50 +34,84 @@ class TestVaultSourceInvariants:
         """
         # .write_bytes( appears in retrieve? No — only read_bytes is used there.
         # We ban write_bytes entirely in the module to prevent misuse.
-        assert ".write_bytes(" not in _VAULT_SRC, (
+        assert ".write_bytes(" not in vault_src, (
             "REGRESSION: vault.py contains .write_bytes() — "
             "evidence must use atomic write (temp → fsync → os.replace)"
         )
 
-    def test_uses_atomic_rename(self) -> None:
+    def test_uses_atomic_rename(self, vault_src: str) -> None:
         """vault.py must use os.replace() for atomic rename."""
-        assert "os.replace" in _VAULT_SRC, (
+        assert "os.replace" in vault_src, (
             "REGRESSION: vault.py missing os.replace() — "
             "atomic rename is required for evidence integrity"
         )
 
-    def test_uses_tempfile(self) -> None:
+    def test_uses_tempfile(self, vault_src: str) -> None:
         """vault.py must create temp files via tempfile.mkstemp()."""
-        assert "mkstemp" in _VAULT_SRC, (
+        assert "mkstemp" in vault_src, (
             "REGRESSION: vault.py missing tempfile.mkstemp() — "
             "temp file in same directory is required for atomic write"
         )
 
-    def test_uses_fsync(self) -> None:
+    def test_uses_fsync(self, vault_src: str) -> None:
         """vault.py must fsync before rename for durability."""
-        assert "os.fsync" in _VAULT_SRC, (
+        assert "os.fsync" in vault_src, (
             "REGRESSION: vault.py missing os.fsync() — "
             "fsync is required before atomic rename for crash safety"
         )
 
-    def test_uses_directory_fsync(self) -> None:
+    def test_uses_directory_fsync(self, vault_src: str) -> None:
         """vault.py must fsync the directory after rename for full durability."""
         # The directory fsync pattern: os.open(..., O_RDONLY) + os.fsync(dir_fd)
-        assert "O_RDONLY" in _VAULT_SRC, (
+        assert "O_RDONLY" in vault_src, (
             "REGRESSION: vault.py missing directory fsync — "
             "directory must be fsync'd after os.replace for power-loss durability"
         )
 
-    def test_enforces_size_limit(self) -> None:
+    def test_enforces_size_limit(self, vault_src: str) -> None:
         """vault.py must enforce _MAX_EVIDENCE_BYTES."""
-        assert "_MAX_EVIDENCE_BYTES" in _VAULT_SRC, (
+        assert "_MAX_EVIDENCE_BYTES" in vault_src, (
             "REGRESSION: vault.py missing size limit — "
             "CWE-400 defence requires an explicit max evidence size"
         )
 
-    def test_uses_safe_vault_path(self) -> None:
+    def test_uses_safe_vault_path(self, vault_src: str) -> None:
         """vault.py must use _safe_vault_path for path traversal defence."""
-        assert "_safe_vault_path" in _VAULT_SRC, (
+        assert "_safe_vault_path" in vault_src, (
             "REGRESSION: vault.py missing path traversal guard — "
             "_safe_vault_path is required to anchor all vault paths"
         )
+
+    def test_key_cache_holds_passphrase_hash(self, vault_src: str) -> None:
+        """The derived-key memo must be keyed by a hash, never the passphrase.
+
+        A raw passphrase in a long-lived dict key would pin the secret in
+        memory for the life of the process.
+        """
+        assert (
+            "cache_key = (hashlib.sha256(passphrase_bytes).digest(), salt)" in vault_src
+        ), (
+            "REGRESSION: vault.py key cache is not keyed by sha256(passphrase) — "
+            "plaintext passphrases must not be retained as cache keys"
+        )
+
+    def test_uses_aesgcm_not_fernet(self, vault_src: str) -> None:
+        """vault.py must encrypt with AES-256-GCM, never fall back to Fernet."""
+        assert "cryptography.fernet" not in vault_src, (
+            "REGRESSION: vault.py imports Fernet — "
+            "evidence must use AES-256-GCM (see module docstring)"
+        )
+        assert "aead import AESGCM" in vault_src, (
+            "REGRESSION: vault.py no longer uses AESGCM — "
+            "evidence must use AES-256-GCM (see module docstring)"
+        )
+
+    def test_writes_header_and_ciphertext_without_joining(self, vault_src: str) -> None:
+        """vault.py must hand header + ciphertext to the kernel as separate buffers.
+
+        Concatenating them first copies the whole (up to 50 MB) ciphertext.
+        """
+        assert "os.writev" in vault_src, (
+            "REGRESSION: vault.py missing os.writev() — "
+            "header and ciphertext must be written without a joining copy"
+        )
@@ -9,40 +9,63 @@ still validates.
 from __future__ import annotations
 
 import sqlite3
-from pathlib import Path
 
 import pytest
 
-from pgo.core.db import open_db
+from pgo.core.db import _apply_schema
 from pgo.core.repository import create_finding, get_finding, transition_finding
 from pgo.core.models import FindingStatus
 
 
-@pytest.fixture()
-def conn(tmp_path: Path) -> sqlite3.Connection:  # type: ignore[misc]
-    c = open_db(tmp_path / "zt_test.db")
+@pytest.fixture(scope="module")
+def shared_conn() -> sqlite3.Connection:  # type: ignore[misc]
+    """One in-memory DB with the production schema for the whole module."""
+    c = sqlite3.connect(":memory:", isolation_level=None)
+    c.row_factory = sqlite3.Row
+    c.execute("PRAGMA foreign_keys=ON")
+    _apply_schema(c)
     yield c  # type: ignore[misc]
     c.close()
 
 
+@pytest.fixture()
+def conn(shared_conn: sqlite3.Connection) -> sqlite3.Connection:  # type: ignore[misc]
+    """The shared DB inside a transaction that is rolled back after each test.
+
+    Repository writes join a caller's open transaction, so nothing a test
+    does outlives it.
+    """
+    shared_conn.execute("BEGIN")
+    yield shared_conn  # type: ignore[misc]
+    shared_conn.rollback()
+
+
 class TestRepositoryInputValidation:
     """Validate that repository functions reject malicious inputs."""
 
     def test_rejects_sql_injection_finding_id(self, conn: sqlite3.Connection) -> None:
         with pytest.raises(ValueError, match="invalid characters"):
-            create_finding(conn, finding_id="'; DROP TABLE findings;--", broker_name="Test")
+            create_finding(
+                conn, finding_id="'; DROP TABLE findings;--", broker_name="Test"
+            )
 
     def test_rejects_sql_injection_broker(self, conn: sqlite3.Connection) -> None:
         with pytest.raises(ValueError, match="invalid characters"):
-            create_finding(conn, finding_id="f-1", broker_name="'; DELETE FROM events;--")
+            create_finding(
+                conn, finding_id="f-1", broker_name="'; DELETE FROM events;--"
+            )
 
     def test_rejects_path_traversal_url(self, conn: sqlite3.Connection) -> None:
         with pytest.raises(ValueError, match="http/https"):
-            create_finding(conn, finding_id="f-1", broker_name="Test", url="file:///etc/passwd")
+            create_finding(
+                conn, finding_id="f-1", broker_name="Test", url="file:///etc/passwd"
+            )
 
     def test_rejects_javascript_url(self, conn: sqlite3.Connection) -> None:
         with pytest.raises(ValueError, match="http/https"):
-            create_finding(conn, finding_id="f-1", broker_name="Test", url="javascript:alert(1)")
+            create_finding(
+                conn, finding_id="f-1", broker_name="Test", url="javascript:alert(1)"
+            )
 
     def test_rejects_empty_finding_id(self, conn: sqlite3.Connection) -> None:
         with pytest.raises(ValueError, match="must not be empty"):
@@ -53,7 +76,12 @@ class TestRepositoryInputValidation:
             create_finding(conn, finding_id="f-1", broker_name="")
 
     def test_accepts_valid_inputs(self, conn: sqlite3.Connection) -> None:
-        f = create_finding(conn, finding_id="f-1", broker_name="BeenVerified", url="https://beenverified.com")
+        f = create_finding(
+            conn,
+            finding_id="f-1",
+            broker_name="BeenVerified",
+            url="https://beenverified.com",
+        )
         assert f.finding_id == "f-1"
         assert f.broker_name == "BeenVerified"
 
@@ -63,4 +91,6 @@ class TestRepositoryInputValidation:
 
     def test_transition_validates_id(self, conn: sqlite3.Connection) -> None:
         with pytest.raises(ValueError, match="invalid characters"):
-            transition_finding(conn, "'; DROP TABLE findings;--", FindingStatus.CONFIRMED)
+            transition_finding(
+                conn, "'; DROP TABLE findings;--", FindingStatus.CONFIRMED
+            )